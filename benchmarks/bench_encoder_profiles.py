@@ -0,0 +1,48 @@
+"""
+Benchmark encoder profiles: throughput versus encoded size per image format.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_encoder_profiles [--frames 16] [--size 1024]
+"""
+
+import argparse
+import time
+
+import torch
+
+from utils.image import image_batch_to_bytes_list, encoder_profiles
+
+FORMATS = ["image/png", "image/jpeg", "image/webp", "image/tiff"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=16)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    gradient = torch.linspace(0, 1, args.size).view(1, 1, args.size, 1)
+    images = (gradient + 0.1 * torch.rand(args.frames, args.size, args.size, 3)).clamp_(0, 1)
+    raw_megabytes = args.frames * args.size * args.size * 3 / 1e6
+
+    print(f"{args.frames} frames, {args.size}x{args.size} RGB ({raw_megabytes:.1f} MB raw), {args.workers} worker(s)")
+    print(f"{'format':<12} {'profile':<10} {'seconds':>9} {'MB/s':>9} {'bytes':>13} {'ratio':>7}")
+
+    for format in FORMATS:
+        for profile in encoder_profiles:
+            start = time.perf_counter()
+            try:
+                bytes_list = image_batch_to_bytes_list(images, format, args.workers, profile)
+            except (OSError, KeyError) as e:
+                # Codec not available in this Pillow build
+                print(f"{format:<12} {profile:<10} unavailable: {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            total_bytes = sum(len(b) for b in bytes_list)
+            print(f"{format:<12} {profile:<10} {elapsed:>9.3f} {raw_megabytes / elapsed:>9.1f} {total_bytes:>13,} {raw_megabytes * 1e6 / total_bytes:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
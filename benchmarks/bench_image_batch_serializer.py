@@ -0,0 +1,58 @@
+"""
+Benchmark serial versus thread-pooled image batch encoding.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_image_batch_serializer [--frames 64] [--size 1024] [--format image/png]
+"""
+
+import argparse
+import os
+import time
+
+import torch
+
+from utils.image import image_batch_to_bytes_list
+
+
+def _measure(images, format, workers, repeat):
+    """Return best wall time in seconds and total encoded size."""
+    best = None
+    total_bytes = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        bytes_list = image_batch_to_bytes_list(images, format, workers)
+        elapsed = time.perf_counter() - start
+        total_bytes = sum(len(b) for b in bytes_list)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=64)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--format", default="image/png")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    # Smooth gradients plus noise give codecs realistic work
+    gradient = torch.linspace(0, 1, args.size).view(1, 1, args.size, 1)
+    images = (gradient + 0.1 * torch.rand(args.frames, args.size, args.size, 3)).clamp_(0, 1)
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print(f"{args.frames} frames, {args.size}x{args.size}, {args.format}, {cpu_count} CPUs")
+    print(f"{'workers':>8} {'seconds':>10} {'frames/s':>10} {'speedup':>8} {'MB':>10}")
+
+    serial_time = None
+    for workers in worker_counts:
+        elapsed, total_bytes = _measure(images, args.format, workers, args.repeat)
+        if serial_time is None:
+            serial_time = elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {args.frames / elapsed:>10.1f} {serial_time / elapsed:>7.2f}x {total_bytes / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark block-parallel zlib compression against single-threaded zlib.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_parallel_compression [--size-mb 256] [--level 6]
+"""
+
+import argparse
+import os
+import time
+import zlib
+
+from utils.compression import parallel_zlib_compress, compress_block_container, decompress_block_container, DEFAULT_BLOCK_SIZE
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--level", type=int, default=6)
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    args = parser.parse_args()
+
+    # Half compressible text, half random bytes
+    half = args.size_mb * (1 << 19)
+    text = (b"The quick brown fox jumps over the lazy dog. " * (half // 45 + 1))[:half]
+    data = text + os.urandom(half)
+    megabytes = len(data) / 1e6
+
+    print(f"{megabytes:.1f} MB, level {args.level}, {args.block_size:,}-byte blocks, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':<28} {'seconds':>9} {'MB/s':>9} {'bytes':>15}")
+
+    compressed, elapsed = timed(zlib.compress, data, args.level)
+    print(f"{'zlib.compress':<28} {elapsed:>9.3f} {megabytes / elapsed:>9.1f} {len(compressed):>15,}")
+
+    for workers in (2, 4, 8, 0):
+        compressed, elapsed = timed(parallel_zlib_compress, data, args.level, args.block_size, workers)
+        assert zlib.decompress(compressed) == data
+        print(f"{f'parallel stream, workers={workers}':<28} {elapsed:>9.3f} {megabytes / elapsed:>9.1f} {len(compressed):>15,}")
+
+    container, elapsed = timed(compress_block_container, data, "zlib_compression", args.level, args.block_size, 0)
+    print(f"{'block container compress':<28} {elapsed:>9.3f} {megabytes / elapsed:>9.1f} {len(container):>15,}")
+
+    _, elapsed = timed(zlib.decompress, compressed)
+    print(f"{'zlib.decompress':<28} {elapsed:>9.3f} {megabytes / elapsed:>9.1f}")
+
+    decompressed, elapsed = timed(decompress_block_container, container, 0)
+    assert decompressed == data
+    print(f"{'block container decompress':<28} {elapsed:>9.3f} {megabytes / elapsed:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from .frame_calculator import *
 from .zlib_compressor import *
 from .zlib_decompressor import *
+from .bytes_compressor import *
+from .bytes_decompressor import *
 from .bytes_selector import *
 from .bytes_merger import *
 from .bytes_comparer import *
\ No newline at end of file
@@ -0,0 +1,47 @@
+from ... import register_node
+from ...utils.serialization import available_compression_modes, get_compression_codec
+
+
+@register_node(emoji="🧮")
+class BytesCompressor:
+    """
+    Bytes compression node
+    Compress bytes data with a codec from the compression registry (zlib, lzma, bz2, zstd, lz4)
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "data": ("BYTES", {}),
+                "compression_mode": (available_compression_modes, {
+                    "default": available_compression_modes[1],
+                }),
+                "compression_level": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 22,
+                    "step": 1,
+                    "tooltip": "Codec compression level (-1 = codec default), clamped to the codec's range.",
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("BYTES",)
+    RETURN_NAMES = ("compressed_bytes",)
+
+    FUNCTION = "run"
+
+    CATEGORY = "EasyToolkit/Algorithm"
+
+    def run(self, data, compression_mode, compression_level):
+        """
+        Compress bytes data with the selected codec.
+        """
+        codec = get_compression_codec(compression_mode)
+        level = None if compression_level < 0 else compression_level
+        compressed_data = codec.compress(data, level)
+        return (compressed_data,)
@@ -0,0 +1,55 @@
+from ... import register_node
+from ...utils.serialization import available_compression_modes
+from ...utils.compression import decompress_bounded
+
+
+@register_node(emoji="🧮")
+class BytesDecompressor:
+    """
+    Bytes decompression node
+    Decompress bytes data with a codec from the compression registry (zlib, lzma, bz2, zstd, lz4)
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "data": ("BYTES", {}),
+                "compression_mode": (available_compression_modes, {
+                    "default": available_compression_modes[1],
+                }),
+            },
+            "optional": {
+                "max_output_size": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                    "tooltip": "Abort when the decompressed size exceeds this many bytes (0 = unlimited).",
+                }),
+                "expected_size": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                    "tooltip": "Known decompressed size, the output buffer is allocated once (0 = unknown).",
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("BYTES",)
+    RETURN_NAMES = ("decompressed_bytes",)
+
+    FUNCTION = "run"
+
+    CATEGORY = "EasyToolkit/Algorithm"
+
+    def run(self, data, compression_mode, max_output_size=0, expected_size=0):
+        """
+        Decompress bytes data with the selected codec and bounded memory.
+        """
+        decompressed_data = decompress_bounded(data, compression_mode, max_output_size, expected_size)
+        return (decompressed_data,)
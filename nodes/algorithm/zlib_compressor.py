@@ -1,11 +1,16 @@
 from ... import register_node
+from ...utils.compression import parallel_zlib_compress, compress_block_container, DEFAULT_BLOCK_SIZE
+from ...utils.serialization import CompressionMode
 import zlib
 
+# Output layouts for compressed data
+zlib_output_modes = ["zlib_stream", "block_container"]
+
 @register_node(emoji="🧮")
 class ZlibCompressor:
     """
     Bytes compression node
-    Compress bytes data using gzip compression
+    Compress bytes data using gzip compression, optionally block-parallel on multiple threads
     """
 
     def __init__(self):
@@ -23,6 +28,26 @@ class ZlibCompressor:
                     "step": 1
                 }),
             },
+            "optional": {
+                "workers": ("INT", {
+                    "default": 1,
+                    "min": 0,
+                    "max": 256,
+                    "step": 1,
+                    "tooltip": "Compression threads (0 = one per CPU core, 1 = serial).",
+                }),
+                "block_size": ("INT", {
+                    "default": DEFAULT_BLOCK_SIZE,
+                    "min": 1 << 16,
+                    "max": 1 << 30,
+                    "step": 1 << 16,
+                    "tooltip": "Uncompressed bytes per block when compressing in parallel.",
+                }),
+                "output_mode": (zlib_output_modes, {
+                    "default": zlib_output_modes[0],
+                    "tooltip": "zlib_stream is readable by any zlib decoder, block_container also allows parallel decompression.",
+                }),
+            },
         }
 
     RETURN_TYPES = ("BYTES",)
@@ -32,9 +57,14 @@ class ZlibCompressor:
 
     CATEGORY = "EasyToolkit/Algorithm"
 
-    def run(self, data, compression_level):
+    def run(self, data, compression_level, workers=1, block_size=DEFAULT_BLOCK_SIZE, output_mode="zlib_stream"):
         """
         Compress bytes data using gzip compression.
         """
-        compressed_data = zlib.compress(data, level=compression_level)
-        return (compressed_data,)
\ No newline at end of file
+        if output_mode == "block_container":
+            compressed_data = compress_block_container(data, CompressionMode.ZLIB_COMPRESSION, compression_level, block_size, workers)
+        elif workers == 1:
+            compressed_data = zlib.compress(data, level=compression_level)
+        else:
+            compressed_data = parallel_zlib_compress(data, compression_level, block_size, workers)
+        return (compressed_data,)
@@ -1,11 +1,12 @@
 from ... import register_node
-import zlib
+from ...utils.compression import is_block_container, decompress_block_container, decompress_bounded
+from ...utils.serialization import CompressionMode
 
 @register_node(emoji="🧮")
 class ZlibDecompressor:
     """
     Bytes decompression node
-    Decompress gzip-compressed bytes data
+    Decompress gzip-compressed bytes data or block containers written by ZlibCompressor
     """
 
     def __init__(self):
@@ -17,6 +18,29 @@ class ZlibDecompressor:
             "required": {
                 "data": ("BYTES", {}),
             },
+            "optional": {
+                "workers": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 256,
+                    "step": 1,
+                    "tooltip": "Decompression threads for block containers (0 = one per CPU core, 1 = serial).",
+                }),
+                "max_output_size": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                    "tooltip": "Abort when the decompressed size exceeds this many bytes (0 = unlimited).",
+                }),
+                "expected_size": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                    "tooltip": "Known decompressed size, the output buffer is allocated once (0 = unknown).",
+                }),
+            },
         }
 
     RETURN_TYPES = ("BYTES",)
@@ -26,9 +50,12 @@ class ZlibDecompressor:
 
     CATEGORY = "EasyToolkit/Algorithm"
 
-    def run(self, data):
+    def run(self, data, workers=0, max_output_size=0, expected_size=0):
         """
-        Decompress gzip-compressed bytes data.
+        Decompress gzip-compressed bytes data with bounded memory.
         """
-        decompressed_data = zlib.decompress(data)
-        return (decompressed_data,)
\ No newline at end of file
+        if is_block_container(data):
+            decompressed_data = decompress_block_container(data, workers, max_output_size)
+        else:
+            decompressed_data = decompress_bounded(data, CompressionMode.ZLIB_COMPRESSION, max_output_size, expected_size)
+        return (decompressed_data,)
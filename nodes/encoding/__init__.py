@@ -1,4 +1,6 @@
 from .steganography_encoder import *
 from .steganography_decoder import *
 from .bytes_encoder import *
-from .bytes_decoder import *
\ No newline at end of file
+from .bytes_decoder import *
+from .video_steganography_encoder import *
+from .video_steganography_decoder import *
\ No newline at end of file
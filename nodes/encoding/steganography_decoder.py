@@ -1,5 +1,5 @@
 from ... import register_node
-from ...utils.encoding import decode_steganography
+from ...utils.encoding import decode_steganography, decode_steganography_batch, decode_steganography_lsb, is_steganography_shard, steganography_modes
 
 
 @register_node(emoji="🔐")
@@ -34,6 +34,31 @@ class SteganographyDecoder:
                     "display": "number",
                 }),
             },
+            "optional": {
+                "multi_image": ("BOOLEAN", {
+                    "default": False,
+                    "label_on": "sharded batch",
+                    "label_off": "single image",
+                }),
+                "workers": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 256,
+                    "step": 1,
+                    "display": "number",
+                }),
+                "mode": (steganography_modes, {
+                    "default": steganography_modes[0],
+                    "tooltip": "pixel reads data stored as whole channel values (noise image), lsb reads it from the low bits of the whole batch (margins are ignored).",
+                }),
+                "bits_per_channel": ("INT", {
+                    "default": 1,
+                    "min": 1,
+                    "max": 8,
+                    "step": 1,
+                    "display": "number",
+                }),
+            },
         }
 
     RETURN_TYPES = ("BYTES",)
@@ -42,12 +67,22 @@ class SteganographyDecoder:
     CATEGORY = "EasyToolkit/Encoding"
     OUTPUT_NODE = True
 
-    def run(self, steganography_image, top_margin_percent: float = 20.0, bottom_margin_percent: float = 20.0) -> dict:
+    def run(self, steganography_image, top_margin_percent: float = 20.0, bottom_margin_percent: float = 20.0, multi_image: bool = False, workers: int = 0,
+            mode: str = "pixel", bits_per_channel: int = 1) -> dict:
         """
         Decode hidden data from steganography image with optional decompression.
+
+        Sharded batches (multi_image, or a first image starting with a shard
+        header) are decoded concurrently on workers threads (0 = one per CPU
+        core); otherwise the first image is decoded as a single carrier.
         """
         # Extract bytes from steganography image
-        data_bytes = decode_steganography(steganography_image, top_margin_percent / 100, bottom_margin_percent / 100)
+        if mode == "lsb":
+            data_bytes = decode_steganography_lsb(steganography_image, bits_per_channel)
+        elif multi_image or is_steganography_shard(steganography_image, top_margin_percent / 100, bottom_margin_percent / 100):
+            data_bytes = decode_steganography_batch(steganography_image, top_margin_percent / 100, bottom_margin_percent / 100, workers)
+        else:
+            data_bytes = decode_steganography(steganography_image, top_margin_percent / 100, bottom_margin_percent / 100)
 
         return {"result": (data_bytes,)}
 
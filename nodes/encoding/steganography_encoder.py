@@ -1,5 +1,5 @@
 from ... import register_node
-from ...utils.encoding import encode_steganography
+from ...utils.encoding import encode_steganography, encode_steganography_batch, encode_steganography_lsb, steganography_modes
 
 
 @register_node(emoji="🔐")
@@ -55,6 +55,30 @@ class SteganographyEncoder:
                     "step": 1,
                     "display": "number",
                 }),
+                "multi_image": ("BOOLEAN", {
+                    "default": False,
+                    "label_on": "shard across batch",
+                    "label_off": "single image",
+                }),
+                "seed": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                    "display": "number",
+                }),
+                "mode": (steganography_modes, {
+                    "default": steganography_modes[0],
+                    "tooltip": "pixel stores data as whole channel values (noise image), lsb hides it in the low bits of cover_image (margins and size inputs are ignored).",
+                }),
+                "bits_per_channel": ("INT", {
+                    "default": 1,
+                    "min": 1,
+                    "max": 8,
+                    "step": 1,
+                    "display": "number",
+                }),
+                "cover_image": ("IMAGE",),
             },
         }
 
@@ -64,14 +88,30 @@ class SteganographyEncoder:
     CATEGORY = "EasyToolkit/Encoding"
     OUTPUT_NODE = True
 
-    def run(self, data, use_alpha: bool = True, top_margin_percent: float = 20.0, bottom_margin_percent: float = 20.0, width: int = 0, height: int = 0) -> dict:
+    def run(self, data, use_alpha: bool = True, top_margin_percent: float = 20.0, bottom_margin_percent: float = 20.0, width: int = 0, height: int = 0,
+            multi_image: bool = False, seed: int = -1, mode: str = "pixel", bits_per_channel: int = 1, cover_image=None) -> dict:
         """
         Encode data into steganography image with optional compression.
+
+        In multi-image mode data larger than one image is sharded across an
+        image batch of the given fixed width and height. In lsb mode data is
+        hidden in the low bits of the whole cover_image batch instead.
         """
-        # Convert 0 to None for auto-calculation
+        if mode == "lsb":
+            if cover_image is None:
+                raise ValueError("LSB mode requires a cover_image")
+            return {"result": (encode_steganography_lsb(data, cover_image, bits_per_channel),)}
+
+        # Convert 0 to None for auto-calculation, -1 to None for a random seed
         w = None if width == 0 else width
         h = None if height == 0 else height
+        noise_seed = None if seed < 0 else seed
 
-        steganography_image = encode_steganography(data, w, h, use_alpha, top_margin_percent / 100, bottom_margin_percent / 100)
+        if multi_image:
+            if w is None or h is None:
+                raise ValueError("Multi-image mode requires a fixed width and height")
+            steganography_image = encode_steganography_batch(data, w, h, use_alpha, top_margin_percent / 100, bottom_margin_percent / 100, noise_seed)
+        else:
+            steganography_image = encode_steganography(data, w, h, use_alpha, top_margin_percent / 100, bottom_margin_percent / 100, noise_seed)
         return {"result": (steganography_image,)}
 
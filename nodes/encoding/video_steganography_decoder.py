@@ -0,0 +1,56 @@
+import os
+import uuid
+import folder_paths
+
+from ... import register_node
+from ...utils.video import decode_steganography_video
+
+
+@register_node(emoji="🔐")
+class VideoSteganographyDecoder:
+    """
+    Video steganography decoder node.
+
+    Extracts hidden data from a lossless video written by the video
+    steganography encoder, streaming it frame by frame.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "video_data": ("BYTES", {
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("BYTES",)
+    RETURN_NAMES = ("data",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Encoding"
+    OUTPUT_NODE = True
+
+    def run(self, video_data) -> dict:
+        """
+        Decode hidden data from a lossless steganography video.
+        """
+        # Create temporary file for video data
+        temp_path = os.path.join(folder_paths.get_temp_directory(), f"{uuid.uuid4().hex}")
+        try:
+            # Write bytes to temporary file
+            with open(temp_path, "wb") as f:
+                f.write(video_data)
+
+            data_bytes = decode_steganography_video(temp_path)
+        finally:
+            # Clean up temporary file
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except:
+                    pass  # Ignore cleanup errors
+
+        return {"result": (data_bytes,)}
@@ -0,0 +1,79 @@
+import os
+import uuid
+import folder_paths
+
+from ... import register_node
+from ...utils.video import FFMPEG_LOSSLESS_FORMAT_MAPPING, encode_steganography_video, video_steganography_frame_count
+
+
+@register_node(emoji="🔐")
+class VideoSteganographyEncoder:
+    """
+    Video steganography encoder node.
+
+    Streams hidden data frame by frame into a lossless video, for payloads
+    larger than a single image can carry.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        video_formats = list(FFMPEG_LOSSLESS_FORMAT_MAPPING.keys())
+        return {
+            "required": {
+                "data": ("BYTES", {
+                }),
+                "width": ("INT", {
+                    "default": 1024,
+                    "min": 16,
+                    "max": 8192,
+                    "step": 2,
+                    "display": "number",
+                }),
+                "height": ("INT", {
+                    "default": 1024,
+                    "min": 16,
+                    "max": 8192,
+                    "step": 2,
+                    "display": "number",
+                }),
+                "video_format": (video_formats, {
+                    "default": video_formats[0],
+                }),
+                "frame_rate": ("INT", {
+                    "default": 30,
+                    "min": 1,
+                    "step": 1,
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("BYTES", "STRING", "INT",)
+    RETURN_NAMES = ("video_data", "extension", "frame_count",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Encoding"
+    OUTPUT_NODE = True
+
+    def run(self, data, width: int = 1024, height: int = 1024, video_format: str = "ffv1-mkv", frame_rate: int = 30) -> dict:
+        """
+        Encode data into a lossless steganography video.
+        """
+        # Final path including the extension, so a partial file left by a failed encode is cleaned up too
+        extension = FFMPEG_LOSSLESS_FORMAT_MAPPING[video_format]["extension"]
+        result_path = os.path.join(folder_paths.get_temp_directory(), f"{uuid.uuid4().hex}.{extension}")
+        try:
+            result_path, extension = encode_steganography_video(data, result_path, width, height, frame_rate, video_format)
+            with open(result_path, "rb") as f:
+                video_bytes = f.read()
+        finally:
+            # Clean up temporary file
+            if os.path.exists(result_path):
+                try:
+                    os.remove(result_path)
+                except:
+                    pass  # Ignore cleanup errors
+
+        frame_count = video_steganography_frame_count(len(data), width, height)
+        return {"result": (video_bytes, extension, frame_count,)}
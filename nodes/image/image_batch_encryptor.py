@@ -1,6 +1,5 @@
-import torch
 from ... import register_node
-from ...utils.image import encrypt_image
+from ...utils.image import encrypt_image_batch, encryption_operations
 
 
 @register_node(emoji="🖼️")
@@ -8,7 +7,8 @@ class ImageBatchEncryptor:
     """
     Batch image encryption and processing node.
     
-    Supports color inversion and XOR encryption/decryption operations.
+    Supports color inversion and XOR encryption/decryption operations and
+    reports the elapsed time and the measured peak memory of the run.
     """
 
     def __init__(self):
@@ -19,34 +19,42 @@ class ImageBatchEncryptor:
         return {
             "required": {
                 "image_batch": ("IMAGE",),
-                "operation": (["invert", "xor-16", "xor-32", "xor-64", "xor-128"], {
+                "operation": (encryption_operations, {
                     "default": "invert"
                 }),
                 "enable": ("BOOLEAN", {
                     "default": True
                 }),
             },
+            "optional": {
+                "chunk_size": ("INT", {
+                    "default": 16,
+                    "min": 1,
+                    "max": 4096,
+                    "step": 1,
+                }),
+                "in_place": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Write results into the input batch instead of a new tensor. The upstream output is modified.",
+                }),
+                "xor_key": ("STRING", {
+                    "default": "",
+                    "tooltip": "Key for xor-custom: one 8-bit value (e.g. 0x5A) or per-channel values (e.g. 16,32,64).",
+                }),
+            },
         }
 
-    RETURN_TYPES = ("IMAGE",)
-    RETURN_NAMES = ("image_batch",)
+    RETURN_TYPES = ("IMAGE", "FLOAT", "FLOAT",)
+    RETURN_NAMES = ("image_batch", "elapsed_seconds", "peak_memory_mb",)
     FUNCTION = "run"
     CATEGORY = "EasyToolkit/Image"
 
-    def run(self, image_batch, operation, enable):
+    def run(self, image_batch, operation, enable, chunk_size: int = 16, in_place: bool = False, xor_key: str = ""):
         """
         Process image batch with selected encryption operation.
         """
         if not enable:
-            return (image_batch,)
-
-        batch_size = image_batch.shape[0]
-        processed_batch = []
-
-        for i in range(batch_size):
-            single_image = image_batch[i:i + 1]
-            processed_image = encrypt_image(single_image, operation)
-            processed_batch.append(processed_image)
+            return (image_batch, 0.0, 0.0,)
 
-        result_batch = torch.cat(processed_batch, dim=0)
-        return (result_batch,)
+        result_batch, elapsed, peak_memory = encrypt_image_batch(image_batch, operation, chunk_size, in_place, xor_key)
+        return (result_batch, elapsed, peak_memory / (1024 * 1024),)
@@ -1,5 +1,5 @@
 from ... import register_node
-from ...utils.image import encrypt_image
+from ...utils.image import encrypt_image, encryption_operations
 
 
 @register_node(emoji="🖼️")
@@ -18,13 +18,19 @@ class ImageEncryptor:
         return {
             "required": {
                 "image": ("IMAGE",),
-                "operation": (["invert", "xor-16", "xor-32", "xor-64", "xor-128"], {
+                "operation": (encryption_operations, {
                     "default": "invert"
                 }),
                 "enable": ("BOOLEAN", {
                     "default": True
                 }),
             },
+            "optional": {
+                "xor_key": ("STRING", {
+                    "default": "",
+                    "tooltip": "Key for xor-custom: one 8-bit value (e.g. 0x5A) or per-channel values (e.g. 16,32,64).",
+                }),
+            },
         }
 
     RETURN_TYPES = ("IMAGE",)
@@ -32,12 +38,12 @@ class ImageEncryptor:
     FUNCTION = "run"
     CATEGORY = "EasyToolkit/Image"
 
-    def run(self, image, enable, operation):
+    def run(self, image, enable, operation, xor_key: str = ""):
         """
         Process single image with selected encryption operation.
         """
         if not enable:
             return (image,)
 
-        processed_images = encrypt_image(image, operation)
-        return (processed_images,)
\ No newline at end of file
+        processed_images = encrypt_image(image, operation, xor_key)
+        return (processed_images,)
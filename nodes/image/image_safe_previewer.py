@@ -1,8 +1,50 @@
 from ... import register_node
 from ...utils.format import static_image_formats
-from ...utils.image import image_to_bytes
+from ...utils.image import image_to_bytes, encoder_profiles, downscale_image, make_contact_sheet, image_batch_to_uint8, image_fingerprint, lossy_encoder_options
 from ...utils.encoding import encode_bytes
-import base64
+from collections import OrderedDict
+import threading
+
+# Preview formats, WebP is added for fast lossy previews
+preview_formats = static_image_formats + ["image/webp"]
+
+# Recently encoded previews keyed by (fingerprint, format, profile, quality)
+PREVIEW_CACHE_SIZE = 32
+_preview_cache = OrderedDict()
+_preview_cache_lock = threading.Lock()
+
+
+def _encode_preview(preview, format, profile, quality):
+    """
+    Encode a uint8 preview image to base64, reusing cached results for identical previews.
+
+    Args:
+        preview: Preview image as uint8 numpy array (H, W, C)
+        format: Image MIME type
+        profile: Encoder profile name
+        quality: Lossy quality (0 keeps the lossless encoder)
+
+    Returns:
+        Base64 encoded preview string
+    """
+    key = (image_fingerprint(preview), format, profile, quality)
+    with _preview_cache_lock:
+        base64_data = _preview_cache.get(key)
+        if base64_data is not None:
+            _preview_cache.move_to_end(key)
+            return base64_data
+
+    options = lossy_encoder_options(format, quality) if quality > 0 else None
+    base64_data = encode_bytes(image_to_bytes(preview, format, profile, options), "base64")
+
+    with _preview_cache_lock:
+        _preview_cache[key] = base64_data
+        _preview_cache.move_to_end(key)
+        while len(_preview_cache) > PREVIEW_CACHE_SIZE:
+            _preview_cache.popitem(last=False)
+
+    return base64_data
+
 
 @register_node(emoji="🖼️")
 class ImageSafePreviewer:
@@ -18,10 +60,48 @@ class ImageSafePreviewer:
         return {
             "required": {
                 "image": ("IMAGE",),
-                "format": (static_image_formats, {
-                    "default": static_image_formats[0],
+                "format": (preview_formats, {
+                    "default": preview_formats[0],
                 }),
-            }
+            },
+            "optional": {
+                "profile": (encoder_profiles, {
+                    "default": encoder_profiles[0],
+                    "tooltip": "Encoder speed/size trade-off (default keeps the codec defaults).",
+                }),
+                "max_preview_size": ("INT", {
+                    "default": 1024,
+                    "min": 0,
+                    "max": 16384,
+                    "step": 64,
+                    "tooltip": "Downscale the preview so its longest side fits this size (0 = full resolution).",
+                }),
+                "quality": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 100,
+                    "step": 1,
+                    "tooltip": "Lossy preview quality for JPEG/WebP (0 = use the lossless/profile encoder).",
+                }),
+                "grid": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Preview the whole batch as a single contact sheet instead of only the first image.",
+                }),
+                "columns": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 64,
+                    "step": 1,
+                    "tooltip": "Contact sheet columns (0 = square-ish grid).",
+                }),
+                "tile_size": ("INT", {
+                    "default": 256,
+                    "min": 0,
+                    "max": 4096,
+                    "step": 16,
+                    "tooltip": "Maximum width/height of each contact sheet tile (0 = frame size).",
+                }),
+            },
         }
 
     RETURN_TYPES = ()
@@ -30,15 +110,23 @@ class ImageSafePreviewer:
     CATEGORY = "EasyToolkit/Image"
     OUTPUT_NODE = True
 
-    def run(self, image, format="image/png"):
+    def run(self, image, format="image/png", profile="default", max_preview_size=1024, quality=0,
+            grid=False, columns=0, tile_size=256):
         """
-        Convert image to base64 and preview in frontend.
+        Convert image (or a contact sheet of the batch) to base64 and preview in frontend.
         """
-        # Convert image to bytes
-        image_bytes = image_to_bytes(image, format)
+        # Tile the whole batch into one sheet, or keep only the first image
+        preview = make_contact_sheet(image, columns, tile_size) if grid else image[:1]
+
+        # Downscale before encoding
+        preview = image_batch_to_uint8(downscale_image(preview, max_preview_size))[0]
 
-        # Convert bytes to base64
-        base64_data = encode_bytes(image_bytes, "base64")
+        # JPEG can't store alpha
+        if format == "image/jpeg" and preview.ndim == 3 and preview.shape[2] == 4:
+            preview = preview[:, :, :3]
+
+        # Convert image to base64
+        base64_data = _encode_preview(preview, format, profile, quality)
 
         # Return the base64 data for frontend preview
         return {
@@ -49,4 +137,4 @@ class ImageSafePreviewer:
                     "format": format
                 }]
             }
-        }
\ No newline at end of file
+        }
@@ -4,7 +4,13 @@ from .image_batch_serializer import *
 from .image_batch_deserializer import *
 from .video_serializer import *
 from .video_deserializer import *
+from .tensor_serializer import *
+from .tensor_deserializer import *
+from .latent_batch_serializer import *
+from .latent_batch_deserializer import *
 from .resource_header_constructor import *
 from .resource_header_serializer import *
 from .resource_header_deserializer import *
-from .resource_header_parser import *
\ No newline at end of file
+from .resource_header_parser import *
+from .resource_packer import *
+from .resource_unpacker import *
\ No newline at end of file
@@ -1,6 +1,8 @@
+import torch
+
 from ... import register_node
-from ...utils.image import bytes_list_to_image_batch
-from ...utils.serialization import split_bytes_with_headers
+from ...utils.image import bytes_list_to_image_batch, probe_image, image_decode_modes, parse_decode_mode, expand_frames
+from ...utils.serialization import BytesWithHeadersReader, SerializationFormat, bytes_array_formats, select_frame_records
 
 
 @register_node(emoji="📦")
@@ -20,25 +22,78 @@ class ImageBatchDeserializer:
             "required": {
                 "data": ("BYTES",),
             },
+            "optional": {
+                "workers": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 256,
+                    "step": 1,
+                    "tooltip": "Decoder threads (0 = one per CPU core, 1 = serial).",
+                }),
+                "decode_mode": (image_decode_modes, {
+                    "default": image_decode_modes[0],
+                    "tooltip": "Decode at full or reduced (1/2, 1/4, 1/8) resolution, or only read the first header.",
+                }),
+                "serialization_format": (bytes_array_formats, {
+                    "default": bytes_array_formats[0],
+                    "tooltip": "Format written by the serializer, the indexed format allows seeking without scanning.",
+                }),
+                "indices": ("STRING", {
+                    "default": "",
+                    "tooltip": "Frames to decode, e.g. \"0, 5, 10-12\" (empty = use start/end).",
+                }),
+                "start": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "step": 1,
+                    "tooltip": "First frame to decode when indices is empty.",
+                }),
+                "end": ("INT", {
+                    "default": -1,
+                    "min": -1,
+                    "step": 1,
+                    "tooltip": "End frame (exclusive) when indices is empty (-1 = last frame).",
+                }),
+            },
         }
 
-    RETURN_TYPES = ("IMAGE", "MASK", "INT",)
-    RETURN_NAMES = ("images", "masks", "count",)
+    RETURN_TYPES = ("IMAGE", "MASK", "INT", "INT", "INT", "INT", "BOOLEAN",)
+    RETURN_NAMES = ("images", "masks", "count", "width", "height", "channels", "has_alpha",)
     FUNCTION = "run"
     CATEGORY = "EasyToolkit/Serialization"
     OUTPUT_NODE = True
 
-    def run(self, data):
+    def run(self, data, workers: int = 0, decode_mode: str = "full",
+            serialization_format=SerializationFormat.BYTES_WITH_HEADERS, indices: str = "", start: int = 0, end: int = -1):
         """
-        Deserialize merged bytes with size headers to image batch.
+        Deserialize merged bytes with size headers to image batch, decoding only the selected frames.
+
+        Deduplicated batches (leading reference table) are detected automatically: each
+        unique frame is decoded once and expanded back into the batch.
         """
-        # Split the merged bytes into individual bytes objects
-        bytes_list = split_bytes_with_headers(data)
-        count = len(bytes_list)
+        scale = parse_decode_mode(decode_mode)
+
+        # Index the merged bytes, records are zero-copy views into data
+        reader = BytesWithHeadersReader(data, serialization_format=serialization_format)
+        if reader.truncated:
+            print(f"[ImageBatchDeserializer] Warning: ignoring {reader.truncated_bytes} bytes of truncated trailing data")
 
-        # Convert bytes list to image batch
-        images, masks = bytes_list_to_image_batch(bytes_list)
+        # Only the selected frames (or the unique frames they reference) are decoded
+        bytes_list, frame_map, count = select_frame_records(reader, indices, start, end)
 
-        return (images, masks, count,)
+        # Source dimensions of the first image
+        if count > 0:
+            width, height, channels, has_alpha = probe_image(bytes_list[0])
+        else:
+            width, height, channels, has_alpha = 0, 0, 0, False
 
+        if scale is None:
+            # Header only, skip pixel decoding
+            images, masks = torch.empty(0), torch.empty(0)
+        else:
+            # Convert bytes list to image batch
+            images, masks = bytes_list_to_image_batch(bytes_list, workers, scale)
+            if frame_map is not None and count > 0:
+                images, masks = expand_frames(images, frame_map), expand_frames(masks, frame_map)
 
+        return (images, masks, count, width, height, channels, has_alpha,)
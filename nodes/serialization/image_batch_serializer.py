@@ -1,7 +1,7 @@
 from ... import register_node
-from ...utils.image import image_batch_to_bytes_list
+from ...utils.image import image_batch_to_bytes_list, encoder_profiles, find_duplicate_frames
 from ...utils.format import static_image_formats, mime_type_to_file_extension
-from ...utils.serialization import merge_bytes_with_headers
+from ...utils.serialization import BytesWithHeadersWriter, SerializationFormat, bytes_array_formats, dedup_reference_table
 
 
 @register_node(emoji="📦")
@@ -24,6 +24,27 @@ class ImageBatchSerializer:
                     "default": static_image_formats[0]
                 }),
             },
+            "optional": {
+                "workers": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 256,
+                    "step": 1,
+                    "tooltip": "Encoder threads (0 = one per CPU core, 1 = serial).",
+                }),
+                "profile": (encoder_profiles, {
+                    "default": encoder_profiles[0],
+                    "tooltip": "Encoder speed/size trade-off (default keeps the codec defaults).",
+                }),
+                "serialization_format": (bytes_array_formats, {
+                    "default": bytes_array_formats[0],
+                    "tooltip": "Indexed appends an offset index for seeking to single frames, varint uses compact size headers without the 4 GiB record limit.",
+                }),
+                "dedup": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Encode identical frames once and store a reference table (expanded by ImageBatchDeserializer and ResourceUnpacker).",
+                }),
+            },
         }
 
     RETURN_TYPES = ("BYTES", "INT", "STRING",)
@@ -32,16 +53,27 @@ class ImageBatchSerializer:
     CATEGORY = "EasyToolkit/Serialization"
     OUTPUT_NODE = True
 
-    def run(self, image_batch, format="image/png"):
+    def run(self, image_batch, format="image/png", workers: int = 0, profile: str = "default",
+            serialization_format=SerializationFormat.BYTES_WITH_HEADERS, dedup: bool = False):
         """
         Serialize image batch to a single bytes object with size headers.
         """
-        bytes_list = image_batch_to_bytes_list(image_batch, format)
-        count = len(bytes_list)
         suffix = mime_type_to_file_extension(format)
+        count = image_batch.shape[0]
+        writer = BytesWithHeadersWriter(serialization_format=serialization_format)
+
+        if dedup:
+            # Encode unique frames only, the leading reference table maps frames to them
+            unique_indices, frame_map = find_duplicate_frames(image_batch)
+            unique_frames = image_batch if len(unique_indices) == count else image_batch[unique_indices]
+            bytes_list = image_batch_to_bytes_list(unique_frames, format, workers, profile)
+            writer.write(dedup_reference_table(frame_map, len(bytes_list)))
+        else:
+            bytes_list = image_batch_to_bytes_list(image_batch, format, workers, profile)
 
-        # Merge bytes_list into a single bytes object with size headers
-        data = merge_bytes_with_headers(bytes_list)
+        # Merge bytes_list into a single preallocated buffer with size headers
+        writer.write_all(bytes_list)
+        data = writer.getvalue()
 
         return {"result": (data, count, suffix,)}
 
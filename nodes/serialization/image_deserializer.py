@@ -1,5 +1,7 @@
+import torch
+
 from ... import register_node
-from ...utils.image import bytes_to_image
+from ...utils.image import bytes_to_image, probe_image, image_decode_modes, parse_decode_mode
 
 
 @register_node(emoji="📦")
@@ -20,17 +22,31 @@ class ImageDeserializer:
                 "data": ("BYTES", {
                 }),
             },
+            "optional": {
+                "decode_mode": (image_decode_modes, {
+                    "default": image_decode_modes[0],
+                    "tooltip": "Decode at full or reduced (1/2, 1/4, 1/8) resolution, or only read the header.",
+                }),
+            },
         }
 
-    RETURN_TYPES = ("IMAGE", "MASK",)
-    RETURN_NAMES = ("image", "mask",)
+    RETURN_TYPES = ("IMAGE", "MASK", "INT", "INT", "INT", "BOOLEAN",)
+    RETURN_NAMES = ("image", "mask", "width", "height", "channels", "has_alpha",)
     FUNCTION = "run"
     CATEGORY = "EasyToolkit/Serialization"
     OUTPUT_NODE = True
 
-    def run(self, data) -> dict:
+    def run(self, data, decode_mode: str = "full") -> dict:
         """
         Deserialize bytes data to image and mask.
         """
-        image, mask = bytes_to_image(data)
-        return {"result": (image, mask,)}
+        scale = parse_decode_mode(decode_mode)
+        width, height, channels, has_alpha = probe_image(data)
+
+        if scale is None:
+            # Header only, skip pixel decoding
+            image, mask = torch.empty(0), torch.empty(0)
+        else:
+            image, mask = bytes_to_image(data, scale)
+
+        return {"result": (image, mask, width, height, channels, has_alpha,)}
@@ -1,5 +1,5 @@
 from ... import register_node
-from ...utils.image import image_to_bytes
+from ...utils.image import image_to_bytes, encoder_profiles
 from ...utils.format import static_image_formats
 
 
@@ -23,6 +23,12 @@ class ImageSerializer:
                     "default": static_image_formats[0],
                 }),
             },
+            "optional": {
+                "profile": (encoder_profiles, {
+                    "default": encoder_profiles[0],
+                    "tooltip": "Encoder speed/size trade-off (default keeps the codec defaults).",
+                }),
+            },
         }
 
     RETURN_TYPES = ("BYTES", "STRING",)
@@ -31,10 +37,10 @@ class ImageSerializer:
     CATEGORY = "EasyToolkit/Serialization"
     OUTPUT_NODE = True
 
-    def run(self, image, format: str = "image/png") -> dict:
+    def run(self, image, format: str = "image/png", profile: str = "default") -> dict:
         """
         Serialize image to bytes data.
         """
-        image_bytes = image_to_bytes(image, format)
+        image_bytes = image_to_bytes(image, format, profile)
         suffix = format.split("/")[-1]
         return {"result": (image_bytes, suffix,)}
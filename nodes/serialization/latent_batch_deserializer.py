@@ -0,0 +1,61 @@
+from ... import register_node
+from ...utils.tensor import TensorBatchReader
+
+
+@register_node(emoji="📦")
+class LatentBatchDeserializer:
+    """
+    Latent batch deserializer node.
+
+    Reads a frame range from a tensor batch container file through a memory
+    map, so only the selected frames are loaded from disk.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "file_path": ("STRING", {
+                    "default": "",
+                }),
+                "start": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                }),
+                "count": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                    "tooltip": "Number of frames to read (0 = all frames from start).",
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("LATENT", "INT",)
+    RETURN_NAMES = ("latent", "total_count",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, file_path: str, start: int = 0, count: int = 0):
+        """
+        Read frames [start, start + count) from a tensor batch container.
+        """
+        with TensorBatchReader.open(file_path) as reader:
+            # An empty container is valid and yields an empty latent for start 0
+            if start > 0 and start >= len(reader):
+                raise ValueError(f"Start frame {start} out of range for {len(reader)} frames")
+            stop = len(reader) if count == 0 else min(start + count, len(reader))
+
+            # The view pages in only the selected frames; copy them out so the mapping can be closed
+            frames = reader[start:stop]
+            samples = frames.clone()
+            del frames
+            total_count = len(reader)
+
+        return ({"samples": samples}, total_count,)
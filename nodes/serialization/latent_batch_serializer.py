@@ -0,0 +1,49 @@
+import os
+import uuid
+import folder_paths
+
+from ... import register_node
+from ...utils.tensor import write_tensor_batch_container
+
+
+@register_node(emoji="📦")
+class LatentBatchSerializer:
+    """
+    Latent batch serializer node.
+
+    Streams latent samples into a tensor batch container file (one header, an
+    offset table and one contiguous data region) that LatentBatchDeserializer
+    can page through by frame index.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "latent": ("LATENT",),
+                "filename_prefix": ("STRING", {
+                    "default": "latent_batch",
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("STRING", "INT",)
+    RETURN_NAMES = ("file_path", "count",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+    OUTPUT_NODE = True
+
+    def run(self, latent, filename_prefix: str = "latent_batch"):
+        """
+        Write latent samples to a tensor batch container in the output directory.
+        """
+        samples = latent["samples"]
+        file_path = os.path.join(folder_paths.get_output_directory(), f"{filename_prefix}_{uuid.uuid4().hex[:8]}.etrb")
+
+        with open(file_path, "wb") as f:
+            write_tensor_batch_container(f, samples)
+
+        return (file_path, samples.shape[0],)
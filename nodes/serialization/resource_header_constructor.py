@@ -1,5 +1,5 @@
 from ... import register_node
-from ...utils.serialization import ResourceHeader, CompressionMode, SerializationFormat, compression_modes, serialization_formats
+from ...utils.serialization import ResourceHeader, ChecksumMode, CompressionMode, SerializationFormat, checksum_modes, compression_modes, serialization_formats
 from ...utils.format import all_resource_formats
 
 
@@ -8,7 +8,7 @@ class ResourceHeaderConstructor:
     """
     ResourceHeader builder node.
 
-    Creates a ResourceHeader object from format, compression mode, and serialization format inputs.
+    Creates a ResourceHeader object from format, compression mode, serialization format and checksum inputs.
     """
 
     def __init__(self):
@@ -28,6 +28,14 @@ class ResourceHeaderConstructor:
                     "default": serialization_formats[0],
                 }),
             },
+            "optional": {
+                "checksum_mode": (checksum_modes, {
+                    "default": checksum_modes[0],
+                }),
+                "record_checksums": ("BOOLEAN", {
+                    "default": False,
+                }),
+            },
         }
 
     RETURN_TYPES = ("EASYTOOLKIT_RESOURCEHEADER",)
@@ -35,9 +43,9 @@ class ResourceHeaderConstructor:
     FUNCTION = "run"
     CATEGORY = "EasyToolkit/Serialization"
 
-    def run(self, format: str, compression_mode, serialization_format):
+    def run(self, format: str, compression_mode, serialization_format, checksum_mode=ChecksumMode.NO_CHECKSUM, record_checksums: bool = False):
         """
         Create ResourceHeader from input parameters.
         """
-        resource_header = ResourceHeader.from_mime_type(format, compression_mode, serialization_format)
+        resource_header = ResourceHeader.from_mime_type(format, compression_mode, serialization_format, checksum_mode, record_checksums)
         return {"result": (resource_header,)}
\ No newline at end of file
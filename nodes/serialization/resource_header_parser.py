@@ -1,5 +1,5 @@
 from ... import register_node
-from ...utils.serialization import ResourceHeader, compression_modes, serialization_formats
+from ...utils.serialization import ResourceHeader, checksum_modes, compression_modes, serialization_formats
 from ...utils.format import all_resource_formats
 
 
@@ -22,8 +22,8 @@ class ResourceHeaderParser:
             },
         }
 
-    RETURN_TYPES = (all_resource_formats, compression_modes, serialization_formats)
-    RETURN_NAMES = ("format", "compression_mode", "serialization_format")
+    RETURN_TYPES = (all_resource_formats, compression_modes, serialization_formats, checksum_modes, "BOOLEAN")
+    RETURN_NAMES = ("format", "compression_mode", "serialization_format", "checksum_mode", "record_checksums")
     FUNCTION = "run"
     CATEGORY = "EasyToolkit/Serialization"
 
@@ -32,4 +32,5 @@ class ResourceHeaderParser:
         Parse ResourceHeader into individual fields.
         """
 
-        return (resource_header.mime_type, resource_header.compression_mode, resource_header.serialization_format,)
\ No newline at end of file
+        return (resource_header.mime_type, resource_header.compression_mode, resource_header.serialization_format,
+                resource_header.checksum_mode, resource_header.record_checksums,)
\ No newline at end of file
@@ -0,0 +1,98 @@
+import torch
+
+from ... import register_node
+from ...utils.compression import decompress_resource
+from ...utils.format import get_format_category
+from ...utils.image import bytes_list_to_image_batch, expand_frames
+from ...utils.serialization import BytesWithHeadersReader, ChecksumMode, bytes_array_formats, select_frame_records
+from .video_deserializer import VideoDeserializer
+
+
+@register_node(emoji="📦")
+class ResourceUnpacker:
+    """
+    Resource unpacker node.
+
+    Unpacks a resource ([4-byte ResourceHeader][payload]) in one step: parses the header,
+    streams decompression, splits bytes arrays into records and dispatches them to the
+    image, video or raw decoder by MIME category. Records are memoryviews into the
+    payload, so the payload is copied at most once. The data output carries the raw
+    payload of non image/video resources only.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "data": ("BYTES",),
+            },
+            "optional": {
+                "workers": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 256,
+                    "step": 1,
+                    "tooltip": "Image decoder threads (0 = one per CPU core, 1 = serial).",
+                }),
+                "max_output_size": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 0xffffffffffffffff,
+                    "step": 1,
+                    "tooltip": "Abort when the decompressed payload exceeds this many bytes (0 = unlimited).",
+                }),
+                "video_mode": (["ffmpeg", "opencv"], {
+                    "default": "ffmpeg",
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("IMAGE", "MASK", "BYTES", "EASYTOOLKIT_VIDEOINFO", "STRING", "INT",)
+    RETURN_NAMES = ("images", "masks", "data", "video_info", "format", "count",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, data, workers: int = 0, max_output_size: int = 0, video_mode: str = "ffmpeg"):
+        """
+        Unpack resource bytes and decode the payload according to its header.
+        """
+        resource_header, payload = decompress_resource(data, max_output_size)
+
+        # Split bytes arrays into zero-copy record views
+        if resource_header.serialization_format in bytes_array_formats:
+            record_checksum_mode = resource_header.checksum_mode if resource_header.record_checksums else ChecksumMode.NO_CHECKSUM
+            reader = BytesWithHeadersReader(payload, resource_header.serialization_format, record_checksum_mode)
+            if reader.truncated:
+                if record_checksum_mode != ChecksumMode.NO_CHECKSUM:
+                    raise ValueError(f"Resource payload has {reader.truncated_bytes} bytes of truncated trailing data")
+                print(f"[ResourceUnpacker] Warning: ignoring {reader.truncated_bytes} bytes of truncated trailing data")
+
+            # Records are verified as they are collected, so corrupt data is rejected before any decode work starts
+            records = list(reader)
+        else:
+            records = [payload]
+
+        images, masks = torch.empty(0), torch.empty(0)
+        raw_data = b""
+        video_info = None
+        count = len(records)
+
+        category = get_format_category(resource_header.mime_type)
+        if category == "image":
+            # Deduplicated batches decode every unique frame once and expand them back
+            records, frame_map, count = select_frame_records(records)
+            images, masks = bytes_list_to_image_batch(records, workers)
+            if frame_map is not None and count > 0:
+                images, masks = expand_frames(images, frame_map), expand_frames(masks, frame_map)
+        elif category == "video":
+            decoded = [VideoDeserializer().run(record, video_mode) for record in records]
+            images = torch.cat([image_batch for image_batch, _ in decoded]) if decoded else images
+            video_info = decoded[0][1] if decoded else None
+        else:
+            # Raw payload, a decompressed payload is returned without another copy
+            raw_data = payload if isinstance(payload, bytearray) else payload.tobytes()
+
+        return (images, masks, raw_data, video_info, resource_header.mime_type, count,)
@@ -0,0 +1,107 @@
+from ... import register_node
+from ...utils.tensor import raw_bytes_to_tensor
+
+
+@register_node(emoji="📦")
+class ImageTensorDeserializer:
+    """
+    Image tensor deserializer node.
+
+    Deserializes raw tensor bytes to ComfyUI image batch without copying the tensor data (read-only data is copied once).
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "data": ("BYTES",),
+            },
+        }
+
+    RETURN_TYPES = ("IMAGE",)
+    RETURN_NAMES = ("image",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, data):
+        """
+        Deserialize raw tensor bytes to image batch.
+        """
+        image = raw_bytes_to_tensor(data)
+
+        # Add batch dimension if not present
+        if image.ndim == 3:
+            image = image.unsqueeze(0)
+
+        return (image,)
+
+
+@register_node(emoji="📦")
+class MaskTensorDeserializer:
+    """
+    Mask tensor deserializer node.
+
+    Deserializes raw tensor bytes to ComfyUI mask batch without copying the tensor data (read-only data is copied once).
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "data": ("BYTES",),
+            },
+        }
+
+    RETURN_TYPES = ("MASK",)
+    RETURN_NAMES = ("mask",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, data):
+        """
+        Deserialize raw tensor bytes to mask batch.
+        """
+        mask = raw_bytes_to_tensor(data)
+
+        # Add batch dimension if not present
+        if mask.ndim == 2:
+            mask = mask.unsqueeze(0)
+
+        return (mask,)
+
+
+@register_node(emoji="📦")
+class LatentDeserializer:
+    """
+    Latent deserializer node.
+
+    Deserializes raw tensor bytes to ComfyUI latent samples without copying the tensor data (read-only data is copied once).
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "data": ("BYTES",),
+            },
+        }
+
+    RETURN_TYPES = ("LATENT",)
+    RETURN_NAMES = ("latent",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, data):
+        """
+        Deserialize raw tensor bytes to latent.
+        """
+        return ({"samples": raw_bytes_to_tensor(data)},)
@@ -0,0 +1,95 @@
+from ... import register_node
+from ...utils.tensor import tensor_to_raw_bytes
+
+
+@register_node(emoji="📦")
+class ImageTensorSerializer:
+    """
+    Image tensor serializer node.
+
+    Serializes ComfyUI image batch to raw tensor bytes (dtype and shape header followed by the tensor data).
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "image": ("IMAGE",),
+            },
+        }
+
+    RETURN_TYPES = ("BYTES",)
+    RETURN_NAMES = ("data",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, image):
+        """
+        Serialize image batch to raw tensor bytes.
+        """
+        return (tensor_to_raw_bytes(image),)
+
+
+@register_node(emoji="📦")
+class MaskTensorSerializer:
+    """
+    Mask tensor serializer node.
+
+    Serializes ComfyUI mask batch to raw tensor bytes.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "mask": ("MASK",),
+            },
+        }
+
+    RETURN_TYPES = ("BYTES",)
+    RETURN_NAMES = ("data",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, mask):
+        """
+        Serialize mask batch to raw tensor bytes.
+        """
+        return (tensor_to_raw_bytes(mask),)
+
+
+@register_node(emoji="📦")
+class LatentSerializer:
+    """
+    Latent serializer node.
+
+    Serializes the samples tensor of a ComfyUI latent to raw tensor bytes.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "latent": ("LATENT",),
+            },
+        }
+
+    RETURN_TYPES = ("BYTES",)
+    RETURN_NAMES = ("data",)
+    FUNCTION = "run"
+    CATEGORY = "EasyToolkit/Serialization"
+
+    def run(self, latent):
+        """
+        Serialize latent samples to raw tensor bytes.
+        """
+        return (tensor_to_raw_bytes(latent["samples"]),)
@@ -0,0 +1,414 @@
+"""
+Compression utilities for large byte payloads.
+
+Compression codecs release the GIL, so blocks are compressed on a thread pool:
+- Parallel zlib stream: pigz-style standard zlib stream, readable by zlib.decompress
+- Block container: independently compressed blocks with a size table, so
+  decompression can run in parallel too
+
+Decompression of untrusted payloads goes through a streaming engine with an
+output size limit and optional known-size preallocation.
+"""
+
+import bz2
+import lzma
+import struct
+import zlib
+
+from .parallel import parallel_map
+from .serialization import ChecksumMode, CompressionMode, ResourceHeader, RESOURCE_HEADER_SIZE, checksum_size, compute_checksum, get_compression_codec, lz4_frame, zstandard
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+ZLIB_WINDOW_SIZE = 1 << 15
+ADLER_BASE = 65521
+
+# Block container layout:
+# [magic][version][codec header ID][reserved 2 bytes][block_size Q][original_size Q][block_count Q]
+# [compressed block sizes Q * block_count][compressed blocks...], all little-endian
+BLOCK_CONTAINER_MAGIC = b"ETZB"
+BLOCK_CONTAINER_VERSION = 1
+_BLOCK_CONTAINER_HEADER = struct.Struct("<4sBBxxQQQ")
+
+
+def _split_blocks(data, block_size: int) -> list:
+    """Split data into zero-copy memoryview blocks."""
+    view = memoryview(data).cast("B")
+    return [view[offset:offset + block_size] for offset in range(0, len(view), block_size)]
+
+
+def adler32_combine(adler1: int, adler2: int, length2: int) -> int:
+    """
+    Combine two Adler-32 checksums (port of zlib's adler32_combine).
+
+    Args:
+        adler1: Checksum of the first sequence
+        adler2: Checksum of the second sequence
+        length2: Length of the second sequence
+
+    Returns:
+        Checksum of the concatenated sequences
+    """
+    remainder = length2 % ADLER_BASE
+    sum1 = adler1 & 0xFFFF
+    sum2 = (remainder * sum1) % ADLER_BASE
+    sum1 += (adler2 & 0xFFFF) + ADLER_BASE - 1
+    sum2 += ((adler1 >> 16) & 0xFFFF) + ((adler2 >> 16) & 0xFFFF) + ADLER_BASE - remainder
+    if sum1 >= ADLER_BASE:
+        sum1 -= ADLER_BASE
+    if sum1 >= ADLER_BASE:
+        sum1 -= ADLER_BASE
+    if sum2 >= ADLER_BASE << 1:
+        sum2 -= ADLER_BASE << 1
+    if sum2 >= ADLER_BASE:
+        sum2 -= ADLER_BASE
+    return sum1 | (sum2 << 16)
+
+
+def _zlib_header(level: int) -> bytes:
+    """Build the 2-byte zlib stream header for a compression level."""
+    if level < 0:
+        level = 6
+    flevel = 0 if level < 2 else 1 if level < 6 else 2 if level == 6 else 3
+    cmf = 0x78  # deflate, 32K window
+    flg = flevel << 6
+    flg += 31 - ((cmf << 8) + flg) % 31
+    return bytes((cmf, flg))
+
+
+def parallel_zlib_compress(data, level: int = -1, block_size: int = DEFAULT_BLOCK_SIZE, workers: int = 0) -> bytes:
+    """
+    Compress data into a standard zlib stream using block-parallel deflate (pigz-style).
+
+    Each block is deflated independently, primed with the previous 32 KiB as
+    dictionary, and ended with a sync flush so the raw deflate outputs can be
+    concatenated. The Adler-32 checksums of the blocks are combined at the end.
+
+    Args:
+        data: Bytes-like object to compress
+        level: Compression level (-1 to 9)
+        block_size: Uncompressed block size in bytes
+        workers: Worker count (0 = one per CPU core, 1 = serial)
+
+    Returns:
+        bytes: zlib stream readable by zlib.decompress
+    """
+    blocks = _split_blocks(data, max(block_size, ZLIB_WINDOW_SIZE))
+    if len(blocks) <= 1 or workers == 1:
+        return zlib.compress(data, level)
+
+    last_index = len(blocks) - 1
+
+    def compress_block(index):
+        block = blocks[index]
+        if index > 0:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=blocks[index - 1][-ZLIB_WINDOW_SIZE:])
+        else:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        flush_mode = zlib.Z_FINISH if index == last_index else zlib.Z_SYNC_FLUSH
+        return compressor.compress(block) + compressor.flush(flush_mode), zlib.adler32(block)
+
+    results = parallel_map(compress_block, range(len(blocks)), workers)
+
+    checksum = 1
+    for block, (_, block_checksum) in zip(blocks, results):
+        checksum = adler32_combine(checksum, block_checksum, len(block))
+
+    return b"".join([_zlib_header(level)] + [compressed for compressed, _ in results] + [checksum.to_bytes(4, byteorder='big')])
+
+
+def is_block_container(data) -> bool:
+    """Check whether data starts with the block container magic."""
+    return bytes(data[:len(BLOCK_CONTAINER_MAGIC)]) == BLOCK_CONTAINER_MAGIC
+
+
+def compress_block_container(data, compression_mode: CompressionMode = CompressionMode.ZLIB_COMPRESSION, level: int = None,
+                             block_size: int = DEFAULT_BLOCK_SIZE, workers: int = 0) -> bytearray:
+    """
+    Compress data into a block container of independently compressed blocks.
+
+    Args:
+        data: Bytes-like object to compress
+        compression_mode: Codec used for every block
+        level: Compression level (None = codec default)
+        block_size: Uncompressed block size in bytes
+        workers: Worker count (0 = one per CPU core, 1 = serial)
+
+    Returns:
+        bytearray: Block container
+    """
+    codec = get_compression_codec(compression_mode)
+    block_size = max(1, block_size)
+    blocks = _split_blocks(data, block_size)
+    compressed_blocks = parallel_map(lambda block: codec.compress(block, level), blocks, workers)
+
+    header = _BLOCK_CONTAINER_HEADER.pack(BLOCK_CONTAINER_MAGIC, BLOCK_CONTAINER_VERSION, codec.header_id,
+                                          block_size, sum(len(block) for block in blocks), len(blocks))
+    size_table = struct.pack(f"<{len(blocks)}Q", *(len(block) for block in compressed_blocks))
+
+    container = bytearray(len(header) + len(size_table) + sum(len(block) for block in compressed_blocks))
+    container[:len(header)] = header
+    offset = len(header)
+    container[offset:offset + len(size_table)] = size_table
+    offset += len(size_table)
+    for block in compressed_blocks:
+        container[offset:offset + len(block)] = block
+        offset += len(block)
+
+    return container
+
+
+def decompress_block_container(data, workers: int = 0, max_output_size: int = 0) -> bytearray:
+    """
+    Decompress a block container, decompressing blocks in parallel into one preallocated buffer.
+
+    Args:
+        data: Block container bytes
+        workers: Worker count (0 = one per CPU core, 1 = serial)
+        max_output_size: Maximum decompressed size in bytes (0 = unlimited)
+
+    Returns:
+        bytearray: Decompressed data
+
+    Raises:
+        ValueError: If the container is malformed, exceeds max_output_size or a block has an unexpected size
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < _BLOCK_CONTAINER_HEADER.size or not is_block_container(view):
+        raise ValueError("Data is not a block container")
+
+    _, version, header_id, block_size, original_size, block_count = _BLOCK_CONTAINER_HEADER.unpack_from(view)
+    if version != BLOCK_CONTAINER_VERSION:
+        raise ValueError(f"Unsupported block container version: {version}")
+    if block_size == 0:
+        raise ValueError("Invalid block container block size: 0")
+    if max_output_size > 0 and original_size > max_output_size:
+        raise ValueError(f"Decompressed size {original_size} exceeds max_output_size {max_output_size}")
+    if block_count != (original_size + block_size - 1) // block_size:
+        raise ValueError(f"Block count {block_count} does not match original size {original_size}")
+
+    compression_mode = get_compression_codec(header_id).mode
+    table_offset = _BLOCK_CONTAINER_HEADER.size
+    offset = table_offset + block_count * 8
+    if offset > len(view):
+        raise ValueError("Truncated block container size table")
+
+    spans = []
+    for compressed_size in struct.unpack_from(f"<{block_count}Q", view, table_offset):
+        spans.append((offset, compressed_size))
+        offset += compressed_size
+    if offset > len(view):
+        raise ValueError("Truncated block container data")
+
+    output = bytearray(original_size)
+    output_view = memoryview(output)
+
+    def decompress_block(index):
+        start, compressed_size = spans[index]
+        expected_size = min(block_size, original_size - index * block_size)
+        block = decompress_bounded(view[start:start + compressed_size], compression_mode, expected_size, expected_size)
+        if len(block) != expected_size:
+            raise ValueError(f"Block {index} decompressed to {len(block)} bytes, expected {expected_size}")
+        output_view[index * block_size:index * block_size + expected_size] = block
+
+    parallel_map(decompress_block, range(block_count), workers)
+    return output
+
+
+# Zstandard frame layout constants (RFC 8878)
+_ZSTD_SKIPPABLE_MAGIC_MASK = 0xFFFFFFF0
+_ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+_ZSTD_MAX_FRAME_HEADER_SIZE = 18
+_ZSTD_BLOCK_HEADER_SIZE = 3
+_ZSTD_RLE_BLOCK = 1
+
+
+def _check_zstd_frames(view):
+    """
+    Walk the frame and block headers of zstd data without decompressing it.
+
+    Raises:
+        ValueError: If a frame, block or checksum extends past the end of the data
+    """
+    total_length = len(view)
+    offset = 0
+    try:
+        while offset < total_length:
+            if offset + 4 > total_length:
+                raise ValueError("Truncated zstd stream")
+            magic = int.from_bytes(view[offset:offset + 4], byteorder="little")
+            if magic & _ZSTD_SKIPPABLE_MAGIC_MASK == _ZSTD_SKIPPABLE_MAGIC:
+                if offset + 8 > total_length:
+                    raise ValueError("Truncated zstd stream")
+                offset += 8 + int.from_bytes(view[offset + 4:offset + 8], byteorder="little")
+                continue
+
+            header = bytes(view[offset:offset + _ZSTD_MAX_FRAME_HEADER_SIZE])
+            header_size = zstandard.frame_header_size(header)
+            has_checksum = zstandard.get_frame_parameters(header[:header_size]).has_checksum
+            offset += header_size
+
+            last_block = False
+            while not last_block:
+                if offset + _ZSTD_BLOCK_HEADER_SIZE > total_length:
+                    raise ValueError("Truncated zstd stream")
+                block_header = int.from_bytes(view[offset:offset + _ZSTD_BLOCK_HEADER_SIZE], byteorder="little")
+                last_block = bool(block_header & 1)
+                block_type = (block_header >> 1) & 3
+                offset += _ZSTD_BLOCK_HEADER_SIZE + (1 if block_type == _ZSTD_RLE_BLOCK else block_header >> 3)
+
+            if has_checksum:
+                offset += 4
+    except zstandard.ZstdError:
+        # Frame header cut off
+        raise ValueError("Truncated zstd stream")
+
+    if offset > total_length:
+        raise ValueError("Truncated zstd stream")
+
+
+def _decompressed_chunks(data, compression_mode: CompressionMode, chunk_size: int):
+    """
+    Decompress data incrementally, yielding output chunks of at most chunk_size bytes.
+
+    Raises:
+        ValueError: If the compressed stream is truncated
+    """
+    view = memoryview(data).cast("B")
+
+    if compression_mode == CompressionMode.NO_COMPRESSION:
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+        return
+
+    if compression_mode == CompressionMode.ZLIB_COMPRESSION:
+        decompressor = zlib.decompressobj()
+        pending = view
+        while not decompressor.eof:
+            chunk = decompressor.decompress(pending, chunk_size)
+            pending = decompressor.unconsumed_tail
+            if chunk:
+                yield chunk
+            elif not pending:
+                break
+        if not decompressor.eof:
+            raise ValueError("Truncated zlib stream")
+        return
+
+    if not get_compression_codec(compression_mode).available:
+        raise ValueError(f"Compression mode {compression_mode} is not available, install its Python package")
+
+    if compression_mode in (CompressionMode.LZMA_COMPRESSION, CompressionMode.BZ2_COMPRESSION, CompressionMode.LZ4_COMPRESSION):
+        # These decompressors share the max_length / eof / needs_input interface
+        if compression_mode == CompressionMode.LZMA_COMPRESSION:
+            decompressor = lzma.LZMADecompressor()
+        elif compression_mode == CompressionMode.BZ2_COMPRESSION:
+            decompressor = bz2.BZ2Decompressor()
+        else:
+            decompressor = lz4_frame.LZ4FrameDecompressor()
+        chunk = decompressor.decompress(view, max_length=chunk_size)
+        while True:
+            if chunk:
+                yield chunk
+            if decompressor.eof:
+                return
+            if decompressor.needs_input:
+                raise ValueError(f"Truncated {compression_mode} stream")
+            chunk = decompressor.decompress(b"", max_length=chunk_size)
+
+    if compression_mode == CompressionMode.ZSTD_COMPRESSION:
+        # The stream reader never produces more than the requested size per read, but silently
+        # ends early on truncated frames, so the frame structure is checked first
+        _check_zstd_frames(view)
+        with zstandard.ZstdDecompressor().stream_reader(view, read_across_frames=True) as reader:
+            while True:
+                chunk = reader.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    raise ValueError(f"Unsupported compression mode: {compression_mode}")
+
+
+def decompress_bounded(data, compression_mode: CompressionMode = CompressionMode.ZLIB_COMPRESSION, max_output_size: int = 0,
+                       expected_size: int = 0, chunk_size: int = DEFAULT_BLOCK_SIZE) -> bytearray:
+    """
+    Decompress data in a streaming fashion with a bounded output size.
+
+    Output is produced chunk by chunk, so decompression stops as soon as the
+    limit is exceeded instead of materializing the whole output first. With an
+    expected size (e.g. from a header), the output buffer is allocated once and
+    filled in place.
+
+    Args:
+        data: Compressed bytes-like object
+        compression_mode: Codec of data
+        max_output_size: Maximum decompressed size in bytes (0 = unlimited)
+        expected_size: Expected decompressed size used to preallocate the output (0 = unknown)
+        chunk_size: Maximum output bytes produced per decompression step
+
+    Returns:
+        bytearray: Decompressed data
+
+    Raises:
+        ValueError: If the decompressed size exceeds max_output_size or the stream is truncated
+    """
+    if max_output_size > 0 and expected_size > max_output_size:
+        raise ValueError(f"Expected size {expected_size} exceeds max_output_size {max_output_size}")
+
+    output = bytearray(expected_size)
+    position = 0
+    for chunk in _decompressed_chunks(data, compression_mode, chunk_size):
+        end = position + len(chunk)
+        if max_output_size > 0 and end > max_output_size:
+            raise ValueError(f"Decompressed size exceeds max_output_size {max_output_size}")
+
+        if end <= len(output):
+            output[position:end] = chunk
+        else:
+            # Expected size was too small (or unknown), grow the buffer
+            output[position:] = chunk
+        position = end
+
+    # Expected size was too large
+    del output[position:]
+    return output
+
+
+def decompress_resource(data, max_output_size: int = 0, expected_size: int = 0):
+    """
+    Split a resource into its ResourceHeader and payload, decompressing the payload with the header's compression mode.
+
+    Args:
+        data: Resource bytes ([4-byte ResourceHeader][payload][optional payload checksum])
+        max_output_size: Maximum decompressed payload size in bytes (0 = unlimited)
+        expected_size: Expected decompressed payload size used to preallocate the output (0 = unknown)
+
+    Returns:
+        tuple: (ResourceHeader, payload), the payload is a zero-copy memoryview when not compressed, else a bytearray
+
+    Raises:
+        ValueError: If the header is invalid, the payload checksum does not match, the payload exceeds
+            max_output_size or decompression fails
+    """
+    view = memoryview(data).cast("B")
+    resource_header = ResourceHeader.from_bytes(bytes(view[:RESOURCE_HEADER_SIZE]))
+    stored_payload = view[RESOURCE_HEADER_SIZE:]
+
+    # Verify the stored payload before any decompression or decoding work
+    if resource_header.checksum_mode != ChecksumMode.NO_CHECKSUM:
+        digest_size = checksum_size(resource_header.checksum_mode)
+        if len(stored_payload) < digest_size:
+            raise ValueError("Resource payload is too short for its checksum")
+        expected = stored_payload[len(stored_payload) - digest_size:]
+        stored_payload = stored_payload[:len(stored_payload) - digest_size]
+        if compute_checksum(resource_header.checksum_mode, stored_payload) != expected:
+            raise ValueError(f"Resource payload {resource_header.checksum_mode} checksum mismatch")
+
+    if resource_header.compression_mode == CompressionMode.NO_COMPRESSION:
+        payload = stored_payload
+        if max_output_size > 0 and len(payload) > max_output_size:
+            raise ValueError(f"Payload size {len(payload)} exceeds max_output_size {max_output_size}")
+        return resource_header, payload
+
+    payload = decompress_bounded(stored_payload, resource_header.compression_mode, max_output_size, expected_size)
+    return resource_header, payload
@@ -1,14 +1,60 @@
 import base64
+import struct
 import torch
 import numpy as np
 
+from .parallel import parallel_map
+
+# Header at the start of the data area of every shard image in multi-image mode
+STEGANOGRAPHY_SHARD_MAGIC = b"ETS1"
+_SHARD_HEADER = struct.Struct(">4sIIQQ4x")
+STEGANOGRAPHY_SHARD_HEADER_SIZE = _SHARD_HEADER.size  # 32 bytes
+
+
+def _steganography_layout(height: int, width: int, channels: int, top_margin_ratio: float, bottom_margin_ratio: float):
+    """
+    Compute the byte layout of a steganography image.
+
+    Returns:
+        Tuple of (top margin bytes, data area bytes, total bytes)
+    """
+    top_margin_rows = int(height * top_margin_ratio)
+    bottom_margin_rows = int(height * bottom_margin_ratio)
+
+    # Ensure we have at least 1 row for data
+    available_rows = height - top_margin_rows - bottom_margin_rows
+    if available_rows < 1:
+        raise ValueError(f"Margins too large: top {top_margin_ratio * 100}% + bottom {bottom_margin_ratio * 100}% = {top_margin_rows + bottom_margin_rows} rows, leaving no space for data")
+
+    row_bytes = width * channels
+    return top_margin_rows * row_bytes, available_rows * row_bytes, height * row_bytes
+
+
+def _uint8_to_image_tensor(array):
+    """Convert a uint8 array (..., H, W, C) to a float32 image tensor in [0, 1] with a single float allocation."""
+    return torch.from_numpy(array).to(torch.float32).div_(255.0)
+
+
+def _fill_noise(regions, rng):
+    """Fill uint8 array regions with random noise from a single RNG call."""
+    total = sum(region.size for region in regions)
+    if total == 0:
+        return
+    noise = np.frombuffer(rng.bytes(total), dtype=np.uint8)
+    offset = 0
+    for region in regions:
+        region[...] = noise[offset:offset + region.size].reshape(region.shape)
+        offset += region.size
+
+
 def encode_steganography(
         data_bytes: bytes, 
         width: int = None, 
         height: int = None, 
         use_alpha: bool = True, 
         top_margin_ratio: float = 0.2, 
-        bottom_margin_ratio: float = 0.2):
+        bottom_margin_ratio: float = 0.2,
+        seed: int = None):
     """
     Encode bytes into a steganography image.
 
@@ -19,6 +65,7 @@ def encode_steganography(
         use_alpha: Whether to use RGBA (4 channels) or RGB (3 channels) format
         top_margin_ratio: Ratio of top margin to reserve (default: 20%)
         bottom_margin_ratio: Ratio of bottom margin to reserve (default: 20%)
+        seed: Optional noise seed for deterministic output (random if not provided)
 
     Returns:
         Image tensor with encoded data
@@ -50,71 +97,159 @@ def encode_steganography(
         else:  # height is None
             height = (pixels_needed + width - 1) // width  # Round up
 
-    total_pixels = width * height
-    total_capacity = total_pixels * channels
+    total_capacity = width * height * channels
 
     # Check if data fits
     if data_length + 4 > total_capacity:
         raise ValueError(f"Data too large ({data_length} bytes) for image size {width}x{height} with {channels} channels (capacity: {total_capacity - 4} bytes)")
 
-    # Calculate margin rows
-    top_margin_rows = int(height * top_margin_ratio)
-    bottom_margin_rows = int(height * bottom_margin_ratio)
+    top_margin_bytes, data_capacity, total_capacity = _steganography_layout(height, width, channels, top_margin_ratio, bottom_margin_ratio)
 
-    # Ensure we have at least 1 row for data
-    available_rows = height - top_margin_rows - bottom_margin_rows
-    if available_rows < 1:
-        raise ValueError(f"Margins too large: top {top_margin_ratio}% + bottom {bottom_margin_ratio}% = {top_margin_rows + bottom_margin_rows} rows, leaving no space for data")
+    # Check if data fits in data area (4-byte length header + data)
+    if data_length + 4 > data_capacity:
+        raise ValueError(f"Data too large ({data_length + 4} bytes) for data area size {data_capacity // (width * channels)} rows x {width} width with {channels} channels (data capacity: {data_capacity} bytes)")
+
+    # Data area: [4-byte big-endian length][data][noise], margins: noise
+    full_array = np.empty(total_capacity, dtype=np.uint8)
+    data_start = top_margin_bytes + 4
+    data_end = data_start + data_length
+    full_array[top_margin_bytes:data_start] = np.frombuffer(data_length.to_bytes(4, byteorder='big'), dtype=np.uint8)
+    full_array[data_start:data_end] = np.frombuffer(data_bytes, dtype=np.uint8)
+    _fill_noise([full_array[:top_margin_bytes], full_array[data_end:]], np.random.default_rng(seed))
+
+    # Reshape to image format (height, width, channels), convert to float32 [0, 1] and add batch dimension
+    return _uint8_to_image_tensor(full_array.reshape(1, height, width, channels))
+
+
+def encode_steganography_batch(
+        data_bytes: bytes,
+        width: int,
+        height: int,
+        use_alpha: bool = True,
+        top_margin_ratio: float = 0.2,
+        bottom_margin_ratio: float = 0.2,
+        seed: int = None):
+    """
+    Encode bytes into a batch of fixed-size steganography images, sharding data larger than one image.
+
+    The data area of every image starts with a 32-byte shard header
+    (magic b"ETS1", shard index, shard count, shard length, total length, all
+    big-endian) followed by the shard data. All shards are written in one
+    vectorized pass into a single uint8 batch array.
+
+    Args:
+        data_bytes: Bytes to encode
+        width: Width of every output image
+        height: Height of every output image
+        use_alpha: Whether to use RGBA (4 channels) or RGB (3 channels) format
+        top_margin_ratio: Ratio of top margin to reserve (default: 20%)
+        bottom_margin_ratio: Ratio of bottom margin to reserve (default: 20%)
+        seed: Optional noise seed for deterministic output (random if not provided)
 
-    # Create header with data length (4 bytes)
-    header = data_length.to_bytes(4, byteorder='big')
+    Returns:
+        Image batch tensor (shard count, height, width, channels) with encoded data
+    """
+    assert top_margin_ratio >= 0 and top_margin_ratio <= 1, "Top margin ratio must be between 0 and 1"
+    assert bottom_margin_ratio >= 0 and bottom_margin_ratio <= 1, "Bottom margin ratio must be between 0 and 1"
 
-    # Combine header and data
-    full_data = header + data_bytes
+    channels = 4 if use_alpha else 3
+    top_margin_bytes, data_capacity, total_capacity = _steganography_layout(height, width, channels, top_margin_ratio, bottom_margin_ratio)
+
+    shard_capacity = data_capacity - STEGANOGRAPHY_SHARD_HEADER_SIZE
+    if shard_capacity < 1:
+        raise ValueError(f"Data area of {data_capacity} bytes is too small for the {STEGANOGRAPHY_SHARD_HEADER_SIZE}-byte shard header")
+
+    data = np.frombuffer(data_bytes, dtype=np.uint8)
+    data_length = len(data)
+    shard_count = max(1, -(-data_length // shard_capacity))
+
+    batch = np.empty((shard_count, total_capacity), dtype=np.uint8)
+    shard_data = batch[:, top_margin_bytes + STEGANOGRAPHY_SHARD_HEADER_SIZE:top_margin_bytes + data_capacity]
+
+    # Shard headers
+    headers = b"".join(
+        _SHARD_HEADER.pack(STEGANOGRAPHY_SHARD_MAGIC, index, shard_count,
+                           min(shard_capacity, data_length - index * shard_capacity), data_length)
+        for index in range(shard_count))
+    batch[:, top_margin_bytes:top_margin_bytes + STEGANOGRAPHY_SHARD_HEADER_SIZE] = np.frombuffer(headers, dtype=np.uint8).reshape(shard_count, -1)
+
+    # Full shards in one vectorized copy, then the partial last shard
+    full_shards = data_length // shard_capacity
+    shard_data[:full_shards] = data[:full_shards * shard_capacity].reshape(full_shards, shard_capacity)
+    last_length = data_length - full_shards * shard_capacity
+    noise_regions = [batch[:, :top_margin_bytes], batch[:, top_margin_bytes + data_capacity:]]
+    if full_shards < shard_count:
+        shard_data[full_shards, :last_length] = data[full_shards * shard_capacity:]
+        noise_regions.append(shard_data[full_shards, last_length:])
+    _fill_noise(noise_regions, np.random.default_rng(seed))
+
+    return _uint8_to_image_tensor(batch.reshape(shard_count, height, width, channels))
+
+def _data_area_layout(image, top_margin_ratio: float, bottom_margin_ratio: float):
+    """
+    Validate a steganography frame and locate its data area.
 
-    # Calculate capacity in data area (excluding margins)
-    data_capacity = available_rows * width * channels
+    Args:
+        image: Single image tensor (H, W, C)
+        top_margin_ratio: Ratio of top margin to skip
+        bottom_margin_ratio: Ratio of bottom margin to skip
 
-    # Check if data fits in data area
-    if len(full_data) > data_capacity:
-        raise ValueError(f"Data too large ({len(full_data)} bytes) for data area size {available_rows} rows x {width} width with {channels} channels (data capacity: {data_capacity} bytes)")
+    Returns:
+        Tuple of (first data row, data row count, bytes per row)
+    """
+    assert top_margin_ratio >= 0 and top_margin_ratio <= 1, "Top margin ratio must be between 0 and 1"
+    assert bottom_margin_ratio >= 0 and bottom_margin_ratio <= 1, "Bottom margin ratio must be between 0 and 1"
 
-    # Create full image array with margins
-    full_array = np.zeros(total_capacity, dtype=np.uint8)
+    middle_ratio = 1 - top_margin_ratio - bottom_margin_ratio
+    assert middle_ratio > 0, "Middle ratio must be greater than 0"
 
-    # Fill top margin with random noise
-    top_margin_bytes = top_margin_rows * width * channels
-    full_array[:top_margin_bytes] = np.random.randint(0, 256, top_margin_bytes, dtype=np.uint8)
+    # Handle different channel configurations
+    if image.ndim == 2:
+        # Grayscale - can't decode, need at least RGB
+        raise ValueError("Cannot decode from grayscale image, need at least 3 channels")
+    elif image.shape[2] not in (3, 4):
+        raise ValueError(f"Unexpected number of channels: {image.shape[2]}")
 
-    # Fill data area
-    data_area_start = top_margin_bytes
-    data_area_end = data_area_start + len(full_data)
-    full_array[data_area_start:data_area_end] = np.frombuffer(full_data, dtype=np.uint8)
+    height, width, channels = image.shape[:3]
+    top_margin_bytes, data_area_bytes, _ = _steganography_layout(height, width, channels, top_margin_ratio, bottom_margin_ratio)
+    row_bytes = width * channels
+    return top_margin_bytes // row_bytes, data_area_bytes // row_bytes, row_bytes
 
-    # Fill remaining data area with random noise
-    remaining_data_bytes = data_capacity - len(full_data)
-    full_array[data_area_end:data_area_end + remaining_data_bytes] = np.random.randint(0, 256, remaining_data_bytes, dtype=np.uint8)
 
-    # Fill bottom margin with random noise
-    bottom_margin_start = data_area_start + data_capacity
-    bottom_margin_bytes = bottom_margin_rows * width * channels
-    full_array[bottom_margin_start:bottom_margin_start + bottom_margin_bytes] = np.random.randint(0, 256, bottom_margin_bytes, dtype=np.uint8)
+def _read_data_area(image, first_row: int, row_bytes: int, byte_count: int):
+    """
+    Convert the first byte_count bytes of a frame's data area to uint8.
 
-    # Reshape to image format
-    if use_alpha:
-        # RGBA format (height, width, 4 channels)
-        image_array = full_array.reshape(height, width, 4)
-    else:
-        # RGB format (height, width, 3 channels)
-        image_array = full_array.reshape(height, width, 3)
+    Only the rows covering those bytes are converted, margins and unused data
+    rows are never touched.
+
+    Args:
+        image: Single image tensor (H, W, C), float in [0, 1] or integer
+        first_row: First data row
+        row_bytes: Bytes per row
+        byte_count: Number of data area bytes to read
+
+    Returns:
+        Flat uint8 numpy array of byte_count bytes
+    """
+    rows = image[first_row:first_row + -(-byte_count // row_bytes)]
+    return _tensor_to_uint8(rows).reshape(-1)[:byte_count]
 
-    # Convert to float32 [0, 1] range for ComfyUI
-    image_tensor = torch.from_numpy(image_array.astype(np.float32) / 255.0)
 
-    # Add batch dimension
-    image_tensor = image_tensor.unsqueeze(0)
+def _tensor_to_uint8(image):
+    """Convert a float [0, 1] (or integer) image tensor to a contiguous uint8 numpy array."""
+    if image.is_floating_point():
+        # Float [0, 1] to uint8 [0, 255], truncating like the encoder's inverse
+        image = image.mul(255).clamp_(0, 255)
+    return np.ascontiguousarray(image.to(torch.uint8).numpy())
+
+
+def _as_image_tensor(image):
+    """Accept an image tensor or numpy array and return a CPU tensor."""
+    if isinstance(image, torch.Tensor):
+        return image.detach().cpu()
+    return torch.from_numpy(np.asarray(image))
 
-    return image_tensor
 
 def decode_steganography(image, top_margin_ratio: float = 0.2, bottom_margin_ratio: float = 0.2):
     """
@@ -128,68 +263,284 @@ def decode_steganography(image, top_margin_ratio: float = 0.2, bottom_margin_rat
     Returns:
         Decoded bytes
     """
-    assert top_margin_ratio >= 0 and top_margin_ratio <= 1, "Top margin ratio must be between 0 and 1"
-    assert bottom_margin_ratio >= 0 and bottom_margin_ratio <= 1, "Bottom margin ratio must be between 0 and 1"
-
-    middle_ratio = 1 - top_margin_ratio - bottom_margin_ratio
-    assert middle_ratio > 0, "Middle ratio must be greater than 0"
-    # Handle tensor input
-    if isinstance(image, torch.Tensor):
-        image = image.detach().cpu().numpy()
+    image = _as_image_tensor(image)
 
     # Remove batch dimension if present
     if image.ndim == 4:
         image = image[0]
 
-    # Convert from float32 [0, 1] to uint8 [0, 255]
-    if image.dtype == np.float32 or image.dtype == np.float64:
-        image_uint8 = np.clip(image * 255, 0, 255).astype(np.uint8)
-    else:
-        image_uint8 = image.astype(np.uint8)
+    first_row, data_rows, row_bytes = _data_area_layout(image, top_margin_ratio, bottom_margin_ratio)
 
-    # Handle different channel configurations
-    if image_uint8.ndim == 2:
-        # Grayscale - can't decode, need at least RGB
-        raise ValueError("Cannot decode from grayscale image, need at least 3 channels")
-    elif image_uint8.shape[2] == 3:
-        # RGB - use 3 bytes per pixel
-        channels = 3
-    elif image_uint8.shape[2] == 4:
-        # RGBA - use all 4 channels
-        channels = 4
-    else:
-        raise ValueError(f"Unexpected number of channels: {image_uint8.shape[2]}")
+    # Read header (first 4 bytes = data length)
+    data_length = int.from_bytes(_read_data_area(image, first_row, row_bytes, 4).tobytes(), byteorder='big')
 
-    height, width = image_uint8.shape[:2]
+    # Validate data length
+    if data_length < 0 or data_length > data_rows * row_bytes - 4:
+        raise ValueError(f"Invalid data length in image header: {data_length}")
 
-    # Calculate margin rows
-    top_margin_rows = int(height * top_margin_ratio)
-    bottom_margin_rows = int(height * bottom_margin_ratio)
+    # Extract data bytes
+    data_bytes = _read_data_area(image, first_row, row_bytes, 4 + data_length)[4:].tobytes()
 
-    # Ensure we have at least 1 row for data
-    available_rows = height - top_margin_rows - bottom_margin_rows
-    if available_rows < 1:
-        raise ValueError(f"Margins too large: top {top_margin_ratio * 100}% + bottom {bottom_margin_ratio * 100}% = {top_margin_rows + bottom_margin_rows} rows, leaving no space for data")
+    return data_bytes
 
-    # Calculate byte positions
-    top_margin_bytes = top_margin_rows * width * channels
-    data_area_bytes = available_rows * width * channels
 
-    # Extract data area from the flattened image
-    flattened_image = image_uint8.flatten()
-    data_area = flattened_image[top_margin_bytes:top_margin_bytes + data_area_bytes]
+def is_steganography_shard(image, top_margin_ratio: float = 0.2, bottom_margin_ratio: float = 0.2) -> bool:
+    """
+    Check whether a steganography image (or the first image of a batch) starts with a shard header.
 
-    # Read header (first 4 bytes = data length)
-    data_length = int.from_bytes(data_area[:4].tobytes(), byteorder='big')
+    Only the first pixels of the data area are converted.
 
-    # Validate data length
-    if data_length < 0 or data_length > len(data_area) - 4:
-        raise ValueError(f"Invalid data length in image header: {data_length}")
+    Args:
+        image: Image tensor (H, W, C) or batch (B, H, W, C)
+        top_margin_ratio: Ratio of top margin to skip (default: 20%)
+        bottom_margin_ratio: Ratio of bottom margin to skip (default: 20%)
 
-    # Extract data bytes
-    data_bytes = data_area[4:4 + data_length].tobytes()
+    Returns:
+        True if the data area begins with the shard magic
+    """
+    image = _as_image_tensor(image)
+    if image.ndim == 4:
+        if image.shape[0] == 0:
+            return False
+        image = image[0]
 
-    return data_bytes
+    first_row, data_rows, row_bytes = _data_area_layout(image, top_margin_ratio, bottom_margin_ratio)
+    if data_rows * row_bytes < len(STEGANOGRAPHY_SHARD_MAGIC):
+        return False
+    return _read_data_area(image, first_row, row_bytes, len(STEGANOGRAPHY_SHARD_MAGIC)).tobytes() == STEGANOGRAPHY_SHARD_MAGIC
+
+
+def decode_steganography_batch(images, top_margin_ratio: float = 0.2, bottom_margin_ratio: float = 0.2, workers: int = 0):
+    """
+    Decode bytes from a batch of steganography images written by encode_steganography_batch.
+
+    Shard headers are read first to place every shard, then frames are
+    decoded concurrently, each converting only its used data rows and
+    writing straight into one preallocated output buffer. Frames may be in
+    any order.
+
+    Args:
+        images: Image batch tensor with one shard per image
+        top_margin_ratio: Ratio of top margin to skip (default: 20%)
+        bottom_margin_ratio: Ratio of bottom margin to skip (default: 20%)
+        workers: Decoder threads (0 = one per CPU core, 1 = serial)
+
+    Returns:
+        Decoded bytearray
+
+    Raises:
+        ValueError: If a frame is not a shard or the shard set is incomplete or inconsistent
+    """
+    images = _as_image_tensor(images)
+    if images.ndim == 3:
+        images = images.unsqueeze(0)
+    if images.shape[0] == 0:
+        raise ValueError("Cannot decode from an empty image batch")
+
+    first_row, data_rows, row_bytes = _data_area_layout(images[0], top_margin_ratio, bottom_margin_ratio)
+    shard_capacity = data_rows * row_bytes - STEGANOGRAPHY_SHARD_HEADER_SIZE
+    if shard_capacity < 0:
+        raise ValueError(f"Data area of {data_rows * row_bytes} bytes is too small for the {STEGANOGRAPHY_SHARD_HEADER_SIZE}-byte shard header")
+
+    # Pass 1: shard headers only
+    frame_count = images.shape[0]
+    placements = [None] * frame_count
+    total_length = None
+    for frame_index in range(frame_count):
+        header = _read_data_area(images[frame_index], first_row, row_bytes, STEGANOGRAPHY_SHARD_HEADER_SIZE).tobytes()
+        magic, shard_index, shard_count, chunk_length, shard_total = _SHARD_HEADER.unpack(header)
+        if magic != STEGANOGRAPHY_SHARD_MAGIC:
+            raise ValueError(f"Image {frame_index} is not a steganography shard")
+        if shard_count != frame_count or shard_index >= shard_count:
+            raise ValueError(f"Image {frame_index} is shard {shard_index} of {shard_count}, batch has {frame_count} images")
+        if chunk_length > shard_capacity:
+            raise ValueError(f"Invalid shard length in image {frame_index} header: {chunk_length}")
+        if total_length is not None and shard_total != total_length:
+            raise ValueError(f"Image {frame_index} declares total length {shard_total}, expected {total_length}")
+        total_length = shard_total
+        placements[frame_index] = (shard_index, chunk_length)
+
+    # Output offsets follow shard order, not frame order
+    chunk_lengths = [0] * frame_count
+    for shard_index, chunk_length in placements:
+        chunk_lengths[shard_index] = chunk_length
+    if len({shard_index for shard_index, _ in placements}) != frame_count:
+        raise ValueError("Duplicate shard indices in image batch")
+    if sum(chunk_lengths) != total_length:
+        raise ValueError(f"Shards hold {sum(chunk_lengths)} bytes, header declares {total_length}")
+
+    offsets = [0] * frame_count
+    for shard_index in range(1, frame_count):
+        offsets[shard_index] = offsets[shard_index - 1] + chunk_lengths[shard_index - 1]
+
+    # Pass 2: decode data rows concurrently into the preallocated output
+    output = bytearray(total_length)
+    output_array = np.frombuffer(output, dtype=np.uint8)
+
+    def decode_frame(frame_index):
+        shard_index, chunk_length = placements[frame_index]
+        data_area = _read_data_area(images[frame_index], first_row, row_bytes, STEGANOGRAPHY_SHARD_HEADER_SIZE + chunk_length)
+        offset = offsets[shard_index]
+        output_array[offset:offset + chunk_length] = data_area[STEGANOGRAPHY_SHARD_HEADER_SIZE:]
+
+    parallel_map(decode_frame, range(frame_count), workers)
+    return output
+
+
+# "pixel" stores payload bytes as whole channel values, "lsb" hides them in the low bits of a cover image
+steganography_modes = ["pixel", "lsb"]
+
+# Header at the start of the LSB bit stream: magic and big-endian payload length
+STEGANOGRAPHY_LSB_MAGIC = b"ETLS"
+_LSB_HEADER = struct.Struct(">4sQ")
+
+
+# Payload bytes per bits_per_channel processed at once, bounds the unpacked bit arrays
+_LSB_CHUNK_BYTES = 1 << 20
+
+
+def _lsb_symbols(data: np.ndarray, bits_per_channel: int) -> np.ndarray:
+    """Split bytes into bits_per_channel-bit symbols (MSB first), zero padding the last symbol."""
+    bits = np.unpackbits(data)
+    padding = -len(bits) % bits_per_channel
+    if padding:
+        bits = np.concatenate([bits, np.zeros(padding, dtype=np.uint8)])
+    # packbits left-aligns every k-bit row in a byte, shift it down to the symbol value
+    return np.packbits(bits.reshape(-1, bits_per_channel), axis=1).reshape(-1) >> np.uint8(8 - bits_per_channel)
+
+
+def _lsb_bytes(values: np.ndarray, bits_per_channel: int, byte_count: int) -> np.ndarray:
+    """Reassemble bytes from bits_per_channel-bit symbols stored in the low bits of channel values."""
+    # Shifting the symbol to the top of the byte drops the cover bits above it
+    bits = np.unpackbits((values << np.uint8(8 - bits_per_channel)).reshape(-1, 1), axis=1, count=bits_per_channel)
+    return np.packbits(bits.reshape(-1)[:byte_count * 8])
+
+
+def _lsb_value_count(byte_count: int, bits_per_channel: int) -> int:
+    """Number of channel values holding byte_count bytes."""
+    return -(-byte_count * 8 // bits_per_channel)
+
+
+def _lsb_chunks(byte_count: int, bits_per_channel: int):
+    """Yield (start, end) byte ranges whose symbols start on a channel value boundary."""
+    # k bytes are exactly 8 symbols of k bits, so chunks of a multiple of k bytes stay aligned
+    chunk_bytes = _LSB_CHUNK_BYTES * bits_per_channel
+    for start in range(0, byte_count, chunk_bytes):
+        yield start, min(start + chunk_bytes, byte_count)
+
+
+def steganography_lsb_capacity(cover_images, bits_per_channel: int = 1) -> int:
+    """
+    Payload capacity of a cover image batch in LSB mode.
+
+    Args:
+        cover_images: Cover image batch tensor (B, H, W, C)
+        bits_per_channel: Low bits replaced per channel value (1-8)
+
+    Returns:
+        Capacity in bytes
+    """
+    return max(0, cover_images.numel() * bits_per_channel // 8 - _LSB_HEADER.size)
+
+
+def encode_steganography_lsb(data_bytes: bytes, cover_images, bits_per_channel: int = 1):
+    """
+    Hide bytes in the low bits of every channel of a cover image batch.
+
+    The bit stream ([magic][8-byte length][data]) is split into
+    bits_per_channel-bit symbols with unpackbits/packbits and masked into the
+    flattened uint8 batch, frame after frame, in bounded vectorized chunks.
+    Channel values past the payload keep their cover value.
+
+    Args:
+        data_bytes: Bytes to encode
+        cover_images: Cover image batch tensor (B, H, W, C) in [0, 1]
+        bits_per_channel: Low bits replaced per channel value (1-8)
+
+    Returns:
+        Image batch tensor with the same shape as the cover
+
+    Raises:
+        ValueError: If bits_per_channel is out of range or the data does not fit
+    """
+    if not 1 <= bits_per_channel <= 8:
+        raise ValueError(f"Bits per channel must be between 1 and 8, got {bits_per_channel}")
+
+    cover_images = _as_image_tensor(cover_images)
+    if cover_images.ndim == 3:
+        cover_images = cover_images.unsqueeze(0)
+
+    capacity = steganography_lsb_capacity(cover_images, bits_per_channel)
+    if len(data_bytes) > capacity:
+        raise ValueError(f"Data too large ({len(data_bytes)} bytes) for cover batch {tuple(cover_images.shape)} at {bits_per_channel} bits per channel (capacity: {capacity} bytes)")
+
+    stego = _tensor_to_uint8(cover_images)
+    if not cover_images.is_floating_point():
+        # uint8 covers are converted without a copy, never write into the input
+        stego = stego.copy()
+    flat = stego.reshape(-1)
+
+    header = np.frombuffer(_LSB_HEADER.pack(STEGANOGRAPHY_LSB_MAGIC, len(data_bytes)), dtype=np.uint8)
+    data = np.frombuffer(data_bytes, dtype=np.uint8)
+    keep_mask = np.uint8((0xff << bits_per_channel) & 0xff)
+
+    for start, end in _lsb_chunks(len(header) + len(data), bits_per_channel):
+        if start < len(header):
+            chunk = np.concatenate([header[start:], data[:end - len(header)]])
+        else:
+            chunk = data[start - len(header):end - len(header)]
+        symbols = _lsb_symbols(chunk, bits_per_channel)
+        values = flat[start * 8 // bits_per_channel:start * 8 // bits_per_channel + len(symbols)]
+        values &= keep_mask
+        values |= symbols
+
+    return _uint8_to_image_tensor(stego)
+
+
+def decode_steganography_lsb(images, bits_per_channel: int = 1):
+    """
+    Extract bytes hidden by encode_steganography_lsb.
+
+    Only the channel values holding the header and payload are converted,
+    chunk by chunk, straight into a preallocated output buffer.
+
+    Args:
+        images: Image batch tensor (B, H, W, C) with hidden data
+        bits_per_channel: Low bits used per channel value (1-8)
+
+    Returns:
+        Decoded bytearray
+
+    Raises:
+        ValueError: If bits_per_channel is out of range or no valid header is found
+    """
+    if not 1 <= bits_per_channel <= 8:
+        raise ValueError(f"Bits per channel must be between 1 and 8, got {bits_per_channel}")
+
+    flat = _as_image_tensor(images).reshape(-1)
+
+    header_size = _LSB_HEADER.size
+    header_values = _lsb_value_count(header_size, bits_per_channel)
+    if header_values > flat.numel():
+        raise ValueError("Image batch is too small to hold an LSB steganography header")
+    header = _lsb_bytes(_tensor_to_uint8(flat[:header_values]), bits_per_channel, header_size)
+    magic, data_length = _LSB_HEADER.unpack(header.tobytes())
+    if magic != STEGANOGRAPHY_LSB_MAGIC:
+        raise ValueError(f"No LSB steganography header found at {bits_per_channel} bits per channel")
+    if _lsb_value_count(header_size + data_length, bits_per_channel) > flat.numel():
+        raise ValueError(f"Invalid data length in LSB header: {data_length}")
+
+    output = bytearray(data_length)
+    output_array = np.frombuffer(output, dtype=np.uint8)
+    for start, end in _lsb_chunks(header_size + data_length, bits_per_channel):
+        first_value = start * 8 // bits_per_channel
+        values = _tensor_to_uint8(flat[first_value:first_value + _lsb_value_count(end - start, bits_per_channel)])
+        chunk = _lsb_bytes(values, bits_per_channel, end - start)
+        # The header only ever lies in the first chunk
+        skip = max(0, header_size - start)
+        output_array[start + skip - header_size:end - header_size] = chunk[skip:]
+
+    return output
 
 
 def encode_bytes(data: bytes, base: str) -> str:
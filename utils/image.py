@@ -2,46 +2,317 @@ import torch
 import cv2
 import numpy as np
 from PIL import Image
+import hashlib
 import io
+import threading
+import time
 
+from .memory import PeakMemoryMeter
+from .parallel import parallel_map
+from .tensor import tensor_to_raw_bytes, raw_bytes_to_tensor, is_raw_tensor
+
+
+# Encryption operations supported by encrypt_image
+encryption_operations = ["invert", "xor-16", "xor-32", "xor-64", "xor-128", "xor-custom"]
+
+# Number of elements converted per chunk by the fused XOR kernel
+XOR_CHUNK_ELEMENTS = 1 << 20
 
-def invert_colors(image):
-    """Invert image colors (1.0 - image)."""
-    return 1.0 - image
+
+def invert_colors(image, out=None):
+    """Invert image colors (1.0 - image)."""
+    if out is None:
+        return 1.0 - image
+    torch.neg(image, out=out)
+    return out.add_(1.0)
 
 
-def xor_operation(image, key):
-    """Apply XOR operation to image pixels with given key."""
-    # Convert normalized [0,1] image to uint8 [0,255] for bitwise operations
-    images_uint8 = (image * 255).to(torch.uint8)
+def parse_xor_key(key_string: str):
+    """
+    Parse XOR key string.
+
+    Accepts a single 8-bit key ("16", "0x10") or comma separated per-channel keys ("16,32,64").
+
+    Args:
+        key_string: Key string to parse
 
-    # Apply XOR operation for basic encryption/obfuscation
-    processed_images = images_uint8 ^ key
+    Returns:
+        int or list of int
 
-    # Convert back to normalized float32 [0,1]
-    return processed_images.to(torch.float32) / 255.0
+    Raises:
+        ValueError: If the key string is empty or contains values outside 0-255
+    """
+    parts = [part.strip() for part in key_string.split(",") if part.strip()]
+    if not parts:
+        raise ValueError("XOR key must not be empty")
+
+    keys = [int(part, 0) for part in parts]
+    for key in keys:
+        if not (0 <= key <= 255):
+            raise ValueError(f"XOR key must be between 0-255, got {key}")
 
+    return keys[0] if len(keys) == 1 else keys
+
+
+def _xor_keys(key, channels):
+    """Normalize XOR key to a list of 8-bit keys (one key, or one per channel)."""
+    keys = [int(k) for k in key] if isinstance(key, (list, tuple)) else [int(key)]
+    for k in keys:
+        if not (0 <= k <= 255):
+            raise ValueError(f"XOR key must be between 0-255, got {k}")
+    if len(keys) not in (1, channels):
+        raise ValueError(f"Per-channel XOR key needs {channels} values, got {len(keys)}")
+    return keys
 
-def encrypt_image(image, operation):
-    """Apply encryption/obfuscation operation to image."""
+
+def _xor_lookup_table(keys):
+    """Build flattened float32 table mapping (channel, uint8 value) to the XOR-ed normalized value."""
+    values = np.arange(256, dtype=np.uint8)
+    table = values[None, :] ^ np.asarray(keys, dtype=np.uint8)[:, None]
+    return (table.astype(np.float32) / 255.0).reshape(-1)
+
+
+def _xor_lut_kernel(src, dst, keys):
+    """
+    Fused float -> uint8 -> XOR -> float conversion through a lookup table.
+
+    Works on flat contiguous float32 arrays in fixed-size chunks, so only two
+    small scratch buffers are allocated regardless of the image size.
+    """
+    channels = len(keys)
+    table = _xor_lookup_table(keys)
+
+    src_flat = src.reshape(-1)
+    dst_flat = dst.reshape(-1)
+    total = src_flat.size
+
+    # Keep chunks aligned to whole pixels so channel offsets line up
+    chunk = min(XOR_CHUNK_ELEMENTS - XOR_CHUNK_ELEMENTS % channels, total)
+    if chunk == 0:
+        return
+    float_buffer = np.empty(chunk, dtype=np.float32)
+    index_buffer = np.empty(chunk, dtype=np.uint16 if channels > 1 else np.uint8)
+    channel_offsets = np.arange(channels, dtype=np.uint16) * 256
+
+    for start in range(0, total, chunk):
+        count = min(chunk, total - start)
+        values = float_buffer[:count]
+        indices = index_buffer[:count]
+
+        np.multiply(src_flat[start:start + count], 255, out=values)
+        np.clip(values, 0, 255, out=values)
+        np.copyto(indices, values, casting="unsafe")
+        if channels > 1:
+            pixel_indices = indices.reshape(-1, channels)
+            np.add(pixel_indices, channel_offsets, out=pixel_indices)
+
+        np.take(table, indices, out=dst_flat[start:start + count], mode="clip")
+
+
+def _can_use_xor_kernel(tensor):
+    """Check whether tensor can be processed by the numpy lookup table kernel."""
+    return (tensor.device.type == "cpu" and
+            tensor.dtype == torch.float32 and
+            tensor.is_contiguous() and
+            not tensor.requires_grad)
+
+
+def xor_operation(image, key, out=None, in_place=False):
+    """
+    Apply XOR operation to image pixels with given key.
+
+    Args:
+        image: Image tensor in [0, 1] range, channels last
+        key: 8-bit key (0-255) or sequence of per-channel keys
+        out: Optional output tensor to write the result into
+        in_place: Whether to write the result into the input image
+
+    Returns:
+        XOR-ed image tensor in [0, 1] range
+    """
+    if in_place:
+        out = image
+
+    channels = image.shape[-1] if image.ndim > 0 else 1
+    keys = _xor_keys(key, channels)
+
+    if out is None:
+        out = torch.empty_like(image, dtype=torch.float32)
+
+    if _can_use_xor_kernel(image) and _can_use_xor_kernel(out):
+        _xor_lut_kernel(image.numpy(), out.numpy(), keys)
+        return out
+
+    # Fallback for GPU or non-contiguous tensors
+    key_tensor = torch.tensor(keys, dtype=torch.uint8, device=image.device)
+    images_uint8 = (image * 255).clamp_(0, 255).to(torch.uint8)
+    images_uint8 ^= key_tensor
+    return torch.div(images_uint8, 255.0, out=out)
+
+
+def _operation_xor_key(operation, xor_key=None):
+    """Return the XOR key for an operation name, or None for non-XOR operations."""
+    if operation == "xor-custom":
+        return parse_xor_key(xor_key or "")
+    if operation.startswith("xor-"):
+        return int(operation[len("xor-"):])
+    return None
+
+
+def encrypt_image(image, operation, xor_key=None):
+    """
+    Apply encryption/obfuscation operation to image.
+
+    Args:
+        image: Image tensor in [0, 1] range
+        operation: Operation name (see encryption_operations)
+        xor_key: Key string for the "xor-custom" operation (see parse_xor_key)
+
+    Returns:
+        Processed image tensor
+    """
     if operation == "invert":
-        processed_image = invert_colors(image)
-    elif operation == "xor-16":
-        processed_image = xor_operation(image, 16)
-    elif operation == "xor-32":
-        processed_image = xor_operation(image, 32)
-    elif operation == "xor-64":
-        processed_image = xor_operation(image, 64)
-    elif operation == "xor-128":
-        processed_image = xor_operation(image, 128)
-    else:
-        processed_image = image
+        return invert_colors(image)
+
+    key = _operation_xor_key(operation, xor_key)
+    if key is not None:
+        return xor_operation(image, key)
+
+    return image
+
+
+def encrypt_image_batch(images, operation, chunk_size=16, in_place=False, xor_key=None):
+    """
+    Apply encryption/obfuscation operation to a whole image batch.
+
+    The batch is processed in fixed-size chunks written into a single
+    preallocated output tensor (or into the input itself when in_place is
+    set), so peak memory is bounded by the output plus one chunk of scratch.
+
+    Args:
+        images: Image batch tensor (B, H, W, C) in [0, 1] range
+        operation: Operation name (see encryption_operations)
+        chunk_size: Number of frames processed per chunk
+        in_place: Whether to write results into the input tensor
+        xor_key: Key string for the "xor-custom" operation
+
+    Returns:
+        Tuple containing:
+        - processed: Processed image batch tensor
+        - elapsed: Processing time in seconds
+        - peak_memory: Measured peak memory allocated during the operation in bytes
+          (CUDA allocator peak for GPU batches, process RSS growth for CPU batches)
+    """
+    start_time = time.perf_counter()
+
+    key = _operation_xor_key(operation, xor_key)
+    if operation != "invert" and key is None:
+        return images, time.perf_counter() - start_time, 0
+
+    batch_size = images.shape[0]
+    chunk_size = max(1, min(chunk_size, batch_size))
+
+    with PeakMemoryMeter(images.device) as meter:
+        output = images if in_place else torch.empty_like(images)
 
-    return processed_image
+        for chunk_start in range(0, batch_size, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, batch_size)
+            src = images[chunk_start:chunk_end]
+            dst = output[chunk_start:chunk_end]
 
+            if key is None:
+                invert_colors(src, out=dst)
+            else:
+                xor_operation(src, key, out=dst)
+            meter.sample()
 
-def _single_image_to_bytes(image, format="image/png"):
-    """Convert single image (numpy array) to bytes."""
+    return output, time.perf_counter() - start_time, meter.peak_bytes
+
+
+def image_batch_to_uint8(images):
+    """Convert image batch (tensor or numpy) in [0, 1] range to uint8 numpy array in one vectorized pass."""
+    if isinstance(images, torch.Tensor):
+        images = images.detach()
+        if images.dtype != torch.uint8:
+            images = (images * 255).clamp_(0, 255).to(torch.uint8)
+        return images.cpu().numpy()
+
+    if images.dtype != np.uint8:
+        images = np.clip(images * 255, 0, 255).astype(np.uint8)
+    return images
+
+
+# Encoder profiles trading encoding speed against output size ("default" keeps PIL defaults)
+encoder_profiles = ["default", "fastest", "balanced", "smallest"]
+
+# PIL save options per format and profile
+ENCODER_PROFILE_OPTIONS = {
+    "PNG": {
+        "fastest": {"compress_level": 1},
+        "balanced": {"compress_level": 6},
+        "smallest": {"compress_level": 9, "optimize": True},
+    },
+    "JPEG": {
+        "fastest": {"quality": 90, "subsampling": 2},
+        "balanced": {"quality": 90, "subsampling": 2, "optimize": True},
+        "smallest": {"quality": 80, "subsampling": 2, "optimize": True, "progressive": True},
+    },
+    "WEBP": {
+        # Lossy like the default WebP path, method trades encoder speed for size
+        "fastest": {"quality": 80, "method": 0},
+        "balanced": {"quality": 80, "method": 4},
+        "smallest": {"quality": 75, "method": 6},
+    },
+    "TIFF": {
+        "fastest": {"compression": "raw"},
+        "balanced": {"compression": "tiff_lzw"},
+        "smallest": {"compression": "tiff_adobe_deflate"},
+    },
+}
+
+
+def get_encoder_options(format="image/png", profile="default") -> dict:
+    """
+    Get PIL save options for an image format and encoder profile.
+
+    Args:
+        format: Image MIME type
+        profile: Encoder profile name (see encoder_profiles)
+
+    Returns:
+        Dictionary of keyword arguments for PIL.Image.save
+
+    Raises:
+        ValueError: If profile is unknown
+    """
+    if profile not in encoder_profiles:
+        raise ValueError(f"Unknown encoder profile: {profile}. Available profiles: {encoder_profiles}")
+
+    pil_format = format.split("/")[-1].upper()
+    return dict(ENCODER_PROFILE_OPTIONS.get(pil_format, {}).get(profile, {}))
+
+
+def lossy_encoder_options(format="image/jpeg", quality=80) -> dict:
+    """
+    Get fast lossy PIL save options for previews.
+
+    Args:
+        format: Image MIME type
+        quality: Lossy quality (1-100)
+
+    Returns:
+        Dictionary of keyword arguments for PIL.Image.save, empty for formats without a lossy mode
+    """
+    pil_format = format.split("/")[-1].upper()
+    if pil_format == "JPEG":
+        return {"quality": quality, "subsampling": 2}
+    if pil_format == "WEBP":
+        return {"lossless": False, "quality": quality, "method": 0}
+    return {}
+
+
+def _single_image_to_bytes(image, format="image/png", profile="default", options=None):
+    """Convert single image (numpy array) to bytes, options override the encoder profile."""
     # Convert to uint8
     if image.dtype != np.uint8:
         image = np.clip(image * 255, 0, 255).astype(np.uint8)
@@ -51,12 +322,14 @@ def _single_image_to_bytes(image, format="image/png"):
 
     # Save to memory as bytes
     buffer = io.BytesIO()
-    image_pil.save(buffer, format=format.split("/")[-1])
-    buffer.seek(0)
-    return buffer.read()
+    save_options = get_encoder_options(format, profile)
+    if options:
+        save_options.update(options)
+    image_pil.save(buffer, format=format.split("/")[-1], **save_options)
+    return buffer.getvalue()
 
 
-def image_to_bytes(image, format="image/png") -> bytes:
+def image_to_bytes(image, format="image/png", profile="default", options=None) -> bytes:
     """Convert image (tensor or numpy) to bytes."""
     # Handle tensor input
     if isinstance(image, torch.Tensor):
@@ -66,76 +339,397 @@ def image_to_bytes(image, format="image/png") -> bytes:
     if image.ndim == 4:
         image = image[0]
 
-    return _single_image_to_bytes(image, format)
+    return _single_image_to_bytes(image, format, profile, options)
+
+
+def downscale_image(images, max_size: int):
+    """
+    Downscale image batch so that its longest side is at most max_size, keeping aspect ratio.
+
+    Args:
+        images: Image batch tensor (B, H, W, C)
+        max_size: Maximum width/height in pixels (0 to keep the original size)
+
+    Returns:
+        Downscaled image batch tensor, or the input when no downscaling is needed
+    """
+    height, width = images.shape[1:3]
+    if max_size <= 0 or max(height, width) <= max_size:
+        return images
+
+    ratio = max_size / max(height, width)
+    size = (max(1, round(height * ratio)), max(1, round(width * ratio)))
+    resized = torch.nn.functional.interpolate(images.movedim(-1, 1), size=size, mode="area")
+    return resized.movedim(1, -1)
+
+
+def make_contact_sheet(images, columns: int = 0, tile_size: int = 256):
+    """
+    Tile an image batch into a single contact sheet image.
+
+    Args:
+        images: Image batch tensor (B, H, W, C)
+        columns: Number of tiles per row (0 = square-ish grid)
+        tile_size: Maximum width/height of each tile in pixels (0 = keep frame size)
+
+    Returns:
+        Contact sheet tensor (1, rows * tile_h, columns * tile_w, C)
+
+    Raises:
+        ValueError: If the batch is empty
+    """
+    count = images.shape[0]
+    if count == 0:
+        raise ValueError("Cannot build a contact sheet from an empty image batch")
+    if columns <= 0:
+        columns = int(np.ceil(np.sqrt(count)))
+    columns = min(columns, count)
+    rows = (count + columns - 1) // columns
+
+    # Downscale the whole batch at once, then pad it to fill the last row
+    tiles = downscale_image(images, tile_size)
+    padding = rows * columns - count
+    if padding:
+        tiles = torch.cat([tiles, tiles.new_zeros((padding,) + tiles.shape[1:])])
+
+    # (rows * columns, h, w, C) -> (rows, h, columns, w, C) -> (rows * h, columns * w, C)
+    tile_height, tile_width, channels = tiles.shape[1:]
+    sheet = tiles.reshape(rows, columns, tile_height, tile_width, channels).permute(0, 2, 1, 3, 4)
+    return sheet.reshape(1, rows * tile_height, columns * tile_width, channels)
+
+
+def image_fingerprint(image) -> str:
+    """
+    Compute a content fingerprint of an image (tensor or numpy array).
+
+    Args:
+        image: Image tensor or numpy array
+
+    Returns:
+        Hex digest identifying shape, dtype and pixel data
+    """
+    if isinstance(image, torch.Tensor):
+        image = image.detach().cpu().numpy()
+    image = np.ascontiguousarray(image)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.shape}{image.dtype}".encode("utf-8"))
+    digest.update(memoryview(image).cast("B"))
+    return digest.hexdigest()
+
+# Decode modes: full resolution, reduced resolution (1/2, 1/4, 1/8) or header only
+image_decode_modes = ["full", "reduced_2", "reduced_4", "reduced_8", "header_only"]
+
+# OpenCV flags for reduced resolution decoding; EXIF orientation is ignored like in the
+# full-size (IMREAD_UNCHANGED) and PIL draft paths, so every decode mode matches
+_REDUCED_COLOR_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2 | cv2.IMREAD_IGNORE_ORIENTATION,
+    4: cv2.IMREAD_REDUCED_COLOR_4 | cv2.IMREAD_IGNORE_ORIENTATION,
+    8: cv2.IMREAD_REDUCED_COLOR_8 | cv2.IMREAD_IGNORE_ORIENTATION,
+}
+
+
+def parse_decode_mode(decode_mode: str):
+    """
+    Parse decode mode into a downscale factor.
+
+    Args:
+        decode_mode: Decode mode (see image_decode_modes)
+
+    Returns:
+        Downscale factor (1, 2, 4 or 8), or None for header only
+
+    Raises:
+        ValueError: If decode mode is unknown
+    """
+    if decode_mode == "full":
+        return 1
+    if decode_mode == "header_only":
+        return None
+    if decode_mode.startswith("reduced_"):
+        scale = int(decode_mode[len("reduced_"):])
+        if scale in _REDUCED_COLOR_FLAGS:
+            return scale
+    raise ValueError(f"Unknown decode mode: {decode_mode}. Available modes: {image_decode_modes}")
+
+
+def probe_image(image_bytes):
+    """
+    Read image dimensions from the header without decoding pixel data.
+
+    Args:
+        image_bytes: Encoded image bytes
+
+    Returns:
+        Tuple of (width, height, channels, has_alpha)
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image_pil:
+        width, height = image_pil.size
+        bands = image_pil.getbands()
+        has_alpha = "A" in bands or "transparency" in image_pil.info
+
+        if image_pil.mode == "P":
+            # Palette images expand to RGB(A) when decoded
+            channels = 4 if has_alpha else 3
+        else:
+            channels = len(bands)
+
+    return width, height, channels, has_alpha
+
+
+def _decode_image(image_bytes, scale=1):
+    """
+    Decode image bytes, optionally at reduced resolution.
+
+    JPEG is downscaled in the DCT domain through PIL draft(). Other formats use
+    OpenCV reduced decoding, except images with alpha, which are decoded at full
+    resolution and downscaled to keep the alpha channel.
+
+    Args:
+        image_bytes: Encoded image bytes
+        scale: Downscale factor (1, 2, 4 or 8)
+
+    Returns:
+        Tuple of (decoded array, is_rgb) where is_rgb tells whether channels are in RGB instead of OpenCV BGR order
+    """
+    if scale != 1:
+        with Image.open(io.BytesIO(image_bytes)) as image_pil:
+            if image_pil.format == "JPEG":
+                width, height = image_pil.size
+                image_pil.draft("RGB", ((width + scale - 1) // scale, (height + scale - 1) // scale))
+                return np.asarray(image_pil.convert("RGB")), True
+            has_alpha = "A" in image_pil.getbands() or "transparency" in image_pil.info
+
+        if has_alpha:
+            decoded, is_rgb = _decode_image(image_bytes)
+            height, width = decoded.shape[:2]
+            size = ((width + scale - 1) // scale, (height + scale - 1) // scale)
+            return cv2.resize(decoded, size, interpolation=cv2.INTER_AREA), is_rgb
+
+        flags = _REDUCED_COLOR_FLAGS[scale]
+    else:
+        flags = cv2.IMREAD_UNCHANGED
 
-def bytes_to_image(image_bytes):
-    """Convert bytes to image tensor with alpha mask."""
     nparr = np.frombuffer(image_bytes, np.uint8)
 
-    result = cv2.imdecode(nparr, cv2.IMREAD_UNCHANGED)
-    channels = cv2.split(result)
+    result = cv2.imdecode(nparr, flags)
+    if result is None:
+        raise ValueError("Failed to decode image data")
+    return result, False
+
+def _store_decoded_image(decoded, image_out, is_rgb=False):
+    """
+    Write decoded image into a float32 RGB slot.
+
+    Args:
+        decoded: Decoded image array (BGR/BGRA/grayscale from OpenCV, or RGB when is_rgb)
+        image_out: Preallocated float32 numpy array (H, W, 3) to write into
+        is_rgb: Whether decoded is already in RGB order
+
+    Returns:
+        Normalized float32 alpha channel, or None if the image has no alpha
+    """
+    # Normalize by the maximum value of the decoded bit depth
+    if np.issubdtype(decoded.dtype, np.integer):
+        scale = np.float32(np.iinfo(decoded.dtype).max)
+    else:
+        scale = np.float32(1.0)
+
+    alpha = None
+    if decoded.ndim > 2 and decoded.shape[2] >= 4:
+        alpha = decoded[:, :, 3]
+
+    rgb = decoded if is_rgb else _convert_color(decoded)
+    np.divide(rgb, scale, out=image_out)
+
+    if alpha is not None:
+        alpha = alpha.astype(np.float32) / scale  # Normalize alpha to [0,1]
+    return alpha
+
+def bytes_to_image(image_bytes, scale=1):
+    """
+    Convert bytes to image tensor with alpha mask.
+
+    Args:
+        image_bytes: Encoded image bytes
+        scale: Downscale factor (1 for full resolution, 2, 4 or 8 for reduced decoding)
+
+    Returns:
+        Tuple of (image, mask) tensors
+    """
+    decoded, is_rgb = _decode_image(image_bytes, scale)
+    height, width = decoded.shape[:2]
+
+    new_images = torch.empty((1, height, width, 3), dtype=torch.float32)  # With batch dimension
+    alpha = _store_decoded_image(decoded, new_images[0].numpy(), is_rgb)
 
     # Handle alpha channel if present
-    if len(channels) > 3:
-      mask = channels[3].astype(np.float32) / 255.0  # Normalize alpha to [0,1]
-      mask = torch.from_numpy(mask)
+    if alpha is not None:
+        mask = torch.from_numpy(alpha)
     else:
-      # Create solid white mask for images without alpha
-      mask = torch.ones(channels[0].shape, dtype=torch.float32, device="cpu")
+        # Create solid white mask for images without alpha
+        mask = torch.ones((height, width), dtype=torch.float32, device="cpu")
 
-    result = _convert_color(result)
-    result = result.astype(np.float32) / 255.0  # Normalize RGB to [0,1]
-    new_images = torch.from_numpy(result)[None,]  # Add batch dimension
     return new_images, mask
 
 def _convert_color(image):
-    """Convert BGR/BGRA image to RGB format."""
+    """Convert BGR/BGRA/grayscale image to RGB format."""
     # OpenCV loads images as BGR, convert to RGB for consistency
-    if len(image.shape) > 2 and image.shape[2] >= 4:
+    if image.ndim == 2 or image.shape[2] == 1:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+    if image.shape[2] >= 4:
         return cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)  # BGRA to RGB (drop alpha)
     return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)  # BGR to RGB
 
-def image_batch_to_bytes_list(images, format="image/png"):
-    """Convert batch of images to list of bytes."""
-    if isinstance(images, torch.Tensor):
-        images = images.detach().cpu().numpy()
+def image_batch_to_bytes_list(images, format="image/png", workers=1, profile="default"):
+    """
+    Convert batch of images to list of bytes.
+
+    The whole batch is converted to uint8 once, then frames are encoded
+    either serially or on a thread pool (PIL releases the GIL while encoding).
+
+    Args:
+        images: Image batch (tensor or numpy) with shape (B, H, W, C) or (H, W, C)
+        format: Image MIME type
+        workers: Encoder thread count (1 for serial, 0 for one per CPU core)
+        profile: Encoder profile name (see encoder_profiles)
+
+    Returns:
+        List of encoded image bytes, in batch order
+    """
+    images = image_batch_to_uint8(images)
+
+    # Handle single image
+    if images.ndim == 3:
+        images = images[None]
+    elif images.ndim != 4:
+        return []
+
+    return parallel_map(lambda image: _single_image_to_bytes(image, format, profile), images, workers)
+
+def find_duplicate_frames(images):
+    """
+    Find exact duplicate frames in an image batch.
+
+    Every frame gets a cheap vectorized fingerprint (pixel sum and a weighted
+    sum computed with one matmul over the batch). Frames with equal
+    fingerprints are then compared exactly, so fingerprint collisions never
+    merge different frames.
+
+    Args:
+        images: Image batch tensor (B, H, W, C)
+
+    Returns:
+        Tuple of (unique_indices, frame_map): batch indices of the unique frames in
+        first-occurrence order, and the unique position of every frame
+    """
+    count = images.shape[0]
+    if count == 0:
+        return [], []
+
+    flat = images.detach().reshape(count, -1)
+    weights = torch.linspace(1.0, 2.0, flat.shape[1], dtype=flat.dtype, device=flat.device)
+    fingerprints = torch.stack([flat.sum(dim=1), flat @ weights], dim=1).cpu().tolist()
+
+    unique_indices = []
+    frame_map = []
+    candidates = {}
+    for index, fingerprint in enumerate(fingerprints):
+        key = tuple(fingerprint)
+        for position in candidates.get(key, ()):
+            if torch.equal(images[unique_indices[position]], images[index]):
+                frame_map.append(position)
+                break
+        else:
+            candidates.setdefault(key, []).append(len(unique_indices))
+            frame_map.append(len(unique_indices))
+            unique_indices.append(index)
+
+    return unique_indices, frame_map
+
+
+def expand_frames(frames, frame_map):
+    """
+    Expand a batch of unique frames back into the full batch.
+
+    When every frame maps to the same unique frame (or the input is already a
+    broadcast batch), the result is a zero-copy broadcast view; an identity
+    mapping returns the input as is. Otherwise frames are gathered into a new tensor.
+
+    Args:
+        frames: Unique frame tensor (U, ...)
+        frame_map: Unique position of every output frame
+
+    Returns:
+        Tensor (len(frame_map), ...)
+    """
+    if frame_map == list(range(frames.shape[0])):
+        return frames
+
+    if len(set(frame_map)) == 1 or frames.stride(0) == 0:
+        return frames[frame_map[0]:frame_map[0] + 1].expand(len(frame_map), *frames.shape[1:])
+
+    return frames.index_select(0, torch.tensor(frame_map, dtype=torch.long, device=frames.device))
+
+
+def bytes_list_to_image_batch(bytes_list, workers=1, scale=1):
+    """
+    Convert list of bytes to batch of images with masks.
+
+    Dimensions are read from the first image, then the IMAGE and MASK tensors
+    are preallocated and every image is decoded straight into its slot,
+    optionally on a thread pool (cv2.imdecode releases the GIL). When no
+    image has an alpha channel, the mask is a broadcast view of ones.
+
+    Args:
+        bytes_list: List of encoded image bytes (all with the same dimensions)
+        workers: Decoder thread count (1 for serial, 0 for one per CPU core)
+        scale: Downscale factor (1 for full resolution, 2, 4 or 8 for reduced decoding)
+
+    Returns:
+        Tuple of (images, masks) tensors
+    """
+    bytes_list = list(bytes_list)
+    count = len(bytes_list)
+
+    if count == 0:
+        # Return empty tensors if no images
+        return torch.empty(0), torch.empty(0)
 
-    bytes_list = []
-    # Handle batch dimension
-    if images.ndim == 4:
-        for i in range(images.shape[0]):
-            image = images[i]
-            image_bytes = _single_image_to_bytes(image, format)
-            bytes_list.append(image_bytes)
-    elif images.ndim == 3:
-        # Single image
-        image_bytes = _single_image_to_bytes(images, format)
-        bytes_list.append(image_bytes)
+    first = _decode_image(bytes_list[0], scale)
+    height, width = first[0].shape[:2]
 
-    return bytes_list
+    images_batch = torch.empty((count, height, width, 3), dtype=torch.float32)
+    images_array = images_batch.numpy()
 
-def bytes_list_to_image_batch(bytes_list):
-    """Convert list of bytes to batch of images with masks."""
-    images = []
-    masks = []
-
-    for image_bytes in bytes_list:
-        image, mask = bytes_to_image(image_bytes)
-        images.append(image)
-        masks.append(mask)
-
-    # Concatenate all images into a batch
-    if len(images) > 0:
-        images_batch = torch.cat(images, dim=0)
-        masks_batch = torch.stack(masks, dim=0)
-        return images_batch, masks_batch
-    else:
-        # Return empty tensors if no images
-        return torch.empty(0), torch.empty(0)
+    masks_batch = None
+    masks_lock = threading.Lock()
+
+    def decode_into(index):
+        nonlocal masks_batch
+        decoded, is_rgb = first if index == 0 else _decode_image(bytes_list[index], scale)
+        if decoded.shape[:2] != (height, width):
+            raise ValueError(f"Image {index} has size {decoded.shape[1]}x{decoded.shape[0]}, expected {width}x{height}")
+
+        alpha = _store_decoded_image(decoded, images_array[index], is_rgb)
+        if alpha is not None:
+            with masks_lock:
+                if masks_batch is None:
+                    # Images decoded so far had no alpha, so they keep the solid mask
+                    masks_batch = torch.ones((count, height, width), dtype=torch.float32)
+            masks_batch[index] = torch.from_numpy(alpha)
+
+    parallel_map(decode_into, range(count), workers)
+
+    if masks_batch is None:
+        # Solid white masks for images without alpha, without materializing N planes
+        masks_batch = torch.ones((1, height, width), dtype=torch.float32).expand(count, height, width)
+
+    return images_batch, masks_batch
 
 
 def tensor_to_bytes(tensor):
-    """Convert raw tensor to bytes (serialized tensor data)."""
+    """Convert raw tensor to bytes (serialized tensor data, see utils.tensor for the format)."""
     # Handle tensor input
     if isinstance(tensor, torch.Tensor):
         tensor = tensor.detach().cpu()
@@ -147,19 +741,21 @@ def tensor_to_bytes(tensor):
         tensor = tensor[0]
 
     # Serialize tensor to bytes
-    buffer = io.BytesIO()
-    torch.save(tensor, buffer)
-    buffer.seek(0)
-
-    return buffer.read()
+    return tensor_to_raw_bytes(tensor)
 
 
 def bytes_to_tensor(tensor_bytes):
-    """Convert bytes back to tensor (deserialize tensor data)."""
-    buffer = io.BytesIO(tensor_bytes)
-
-    # Load tensor
-    tensor = torch.load(buffer)
+    """
+    Convert bytes back to tensor (deserialize tensor data).
+
+    Raw tensor data is loaded without copying. Data written by older versions
+    with torch.save is still accepted, loaded with weights_only for safety.
+    """
+    if is_raw_tensor(tensor_bytes):
+        tensor = raw_bytes_to_tensor(tensor_bytes)
+    else:
+        # Legacy torch.save format
+        tensor = torch.load(io.BytesIO(tensor_bytes), weights_only=True)
 
     # Add batch dimension if not present
     if tensor.ndim == 3:
@@ -0,0 +1,91 @@
+"""
+Peak memory measurement for a block of work.
+
+CUDA work is measured with the caching allocator statistics. CPU tensors go
+through the system allocator, which tracemalloc does not see, so CPU work is
+measured as the growth of the process resident set size: the kernel
+high-water mark where it can be reset (Linux), otherwise RSS sampled at the
+points the caller marks with sample().
+"""
+
+import re
+
+import psutil
+import torch
+
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+_PROC_STATUS = "/proc/self/status"
+_VM_HWM_PATTERN = re.compile(r"^VmHWM:\s+(\d+)\s+kB", re.MULTILINE)
+
+
+def _read_rss_high_water_mark():
+    """Peak RSS of the process in bytes as tracked by the kernel, or None if unavailable."""
+    try:
+        with open(_PROC_STATUS, "r") as f:
+            match = _VM_HWM_PATTERN.search(f.read())
+    except OSError:
+        return None
+    return int(match.group(1)) * 1024 if match else None
+
+
+def _reset_rss_high_water_mark() -> bool:
+    """Reset the kernel peak RSS to the current RSS (Linux 4.0+)."""
+    try:
+        with open(_PROC_CLEAR_REFS, "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+class PeakMemoryMeter:
+    """
+    Context manager measuring the peak memory allocated inside its block.
+
+    The result (in bytes, relative to the usage on entry) is available as
+    peak_bytes after the block exits. The CPU measurement is process-wide,
+    so memory allocated concurrently by other threads is included.
+
+    Example:
+        with PeakMemoryMeter(images.device) as meter:
+            ...
+        print(meter.peak_bytes)
+    """
+
+    def __init__(self, device=None):
+        self.device = torch.device(device) if device is not None else torch.device("cpu")
+        self.peak_bytes = 0
+        self._baseline = 0
+        self._peak = 0
+        self._use_high_water_mark = False
+        self._process = None
+
+    def __enter__(self):
+        if self.device.type == "cuda":
+            torch.cuda.synchronize(self.device)
+            torch.cuda.reset_peak_memory_stats(self.device)
+            self._baseline = torch.cuda.memory_allocated(self.device)
+        else:
+            self._process = psutil.Process()
+            self._use_high_water_mark = _reset_rss_high_water_mark()
+            self._baseline = self._process.memory_info().rss
+        self._peak = self._baseline
+        return self
+
+    def sample(self):
+        """Record the current usage, used where the kernel high-water mark is unavailable."""
+        if self._process is not None:
+            self._peak = max(self._peak, self._process.memory_info().rss)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.device.type == "cuda":
+            torch.cuda.synchronize(self.device)
+            self._peak = torch.cuda.max_memory_allocated(self.device)
+        else:
+            self.sample()
+            if self._use_high_water_mark:
+                high_water_mark = _read_rss_high_water_mark()
+                if high_water_mark is not None:
+                    self._peak = max(self._peak, high_water_mark)
+        self.peak_bytes = max(0, self._peak - self._baseline)
+        return False
@@ -0,0 +1,83 @@
+"""
+Thread pool utilities for work that releases the GIL (image codecs, compression).
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def resolve_workers(workers: int = 0, task_count: int = None) -> int:
+    """
+    Resolve requested worker count.
+
+    Args:
+        workers: Requested worker count (0 or negative for one worker per CPU core)
+        task_count: Optional number of tasks, the worker count never exceeds it
+
+    Returns:
+        Worker count, at least 1
+    """
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    if task_count is not None:
+        workers = min(workers, task_count)
+    return max(1, workers)
+
+
+def parallel_map(func, items, workers: int = 0) -> list:
+    """
+    Apply func to every item on a thread pool, preserving input order.
+
+    Runs serially in the calling thread when only one worker is used.
+
+    Args:
+        func: Function to apply
+        items: Sequence of items
+        workers: Worker count (0 for one worker per CPU core)
+
+    Returns:
+        List of results in the same order as items
+    """
+    items = list(items)
+    workers = resolve_workers(workers, len(items))
+
+    if workers == 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def parallel_imap(func, items, workers: int = 0, window: int = None):
+    """
+    Lazily apply func to every item on a thread pool, yielding results in input order.
+
+    At most window tasks are in flight at any time, so only a bounded number of
+    results are held in memory while the consumer processes them.
+
+    Args:
+        func: Function to apply
+        items: Iterable of items
+        workers: Worker count (0 for one worker per CPU core)
+        window: Maximum number of tasks in flight (default: twice the worker count)
+
+    Yields:
+        Results in the same order as items
+    """
+    workers = resolve_workers(workers)
+
+    if workers == 1:
+        for item in items:
+            yield func(item)
+        return
+
+    window = max(1, window or workers * 2)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
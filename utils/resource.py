@@ -0,0 +1,143 @@
+"""
+Streaming resource packing: IMAGE batch to encoded, framed, compressed (and optionally base64) bytes in one pass.
+
+Resource layout: [4-byte ResourceHeader][compressed payload][optional payload checksum]
+"""
+
+import base64
+import time
+
+from .image import image_to_bytes
+from .parallel import parallel_imap, resolve_workers
+from .serialization import (
+    BytesWithHeadersWriter, ChecksumMode, CompressionMode, ResourceHeader, SerializationFormat, get_compression_codec,
+    new_checksum,
+)
+
+
+class _PackSink:
+    """
+    Output stage of the pack pipeline.
+
+    Receives framed records from a BytesWithHeadersWriter, compresses them
+    incrementally, updates the payload checksum and appends the result
+    (optionally base64 encoded) to a single output buffer.
+    """
+
+    def __init__(self, compressor, base64_output: bool, timings: dict, checksum=None):
+        self.buffer = bytearray()
+        self._compressor = compressor
+        self._checksum = checksum
+        self._base64_output = base64_output
+        self._base64_carry = b""
+        self._timings = timings
+
+    def _emit(self, data):
+        """Append compressed data to the output buffer, base64 encoding complete 3-byte groups."""
+        if not data:
+            return
+        if not self._base64_output:
+            self.buffer += data
+            return
+
+        start_time = time.perf_counter()
+        data = self._base64_carry + data
+        complete = len(data) - len(data) % 3
+        self.buffer += base64.b64encode(data[:complete])
+        self._base64_carry = data[complete:]
+        self._timings["base64"] += time.perf_counter() - start_time
+
+    def write_uncompressed(self, data):
+        """Append data that bypasses compression (the resource header)."""
+        self._emit(data)
+
+    def write(self, data):
+        """Compress and append framed record data."""
+        start_time = time.perf_counter()
+        compressed = self._compressor.compress(data)
+        self._timings["compress"] += time.perf_counter() - start_time
+        self._emit_payload(compressed)
+
+    def _emit_payload(self, compressed):
+        """Append compressed payload data, updating the payload checksum."""
+        if self._checksum is not None and compressed:
+            start_time = time.perf_counter()
+            self._checksum.update(compressed)
+            self._timings["checksum"] += time.perf_counter() - start_time
+        self._emit(compressed)
+
+    def finish(self):
+        """Flush the compressor, append the payload checksum and the pending base64 bytes."""
+        start_time = time.perf_counter()
+        compressed = self._compressor.flush()
+        self._timings["compress"] += time.perf_counter() - start_time
+        self._emit_payload(compressed)
+
+        if self._checksum is not None:
+            self._emit(self._checksum.digest())
+
+        if self._base64_output and self._base64_carry:
+            self.buffer += base64.b64encode(self._base64_carry)
+            self._base64_carry = b""
+
+
+def pack_image_batch(images, format: str = "image/png",
+                     compression_mode: CompressionMode = CompressionMode.ZLIB_COMPRESSION,
+                     serialization_format: SerializationFormat = SerializationFormat.BYTES_WITH_HEADERS,
+                     compression_level: int = None, profile: str = "default", workers: int = 0,
+                     base64_output: bool = False, checksum_mode: ChecksumMode = ChecksumMode.NO_CHECKSUM,
+                     record_checksums: bool = False):
+    """
+    Pack an image batch into a resource in a single streaming pass.
+
+    Frames are encoded on a thread pool with a bounded number in flight, framed
+    in order, compressed incrementally and appended to one output buffer, so no
+    full-size intermediate is materialized.
+
+    Args:
+        images: Image batch tensor (B, H, W, C)
+        format: Image MIME type for every frame
+        compression_mode: Codec applied to the framed payload
+        serialization_format: One of bytes_array_formats
+        compression_level: Compression level (None = codec default)
+        profile: Encoder profile name
+        workers: Encoder threads (0 = one per CPU core, 1 = serial)
+        base64_output: Whether to base64 encode the output
+        checksum_mode: Checksum appended to the payload (and records), computed while streaming
+        record_checksums: Whether every record also carries a checksum of its data
+
+    Returns:
+        tuple: (output bytearray, frame count, timings dict in seconds with keys
+               encode (cumulative across workers), frame, compress, checksum, base64, total)
+    """
+    timings = {"encode": 0.0, "frame": 0.0, "compress": 0.0, "checksum": 0.0, "base64": 0.0, "total": 0.0}
+    start_time = time.perf_counter()
+
+    resource_header = ResourceHeader.from_mime_type(format, compression_mode, serialization_format, checksum_mode, record_checksums)
+    payload_checksum = new_checksum(checksum_mode) if checksum_mode != ChecksumMode.NO_CHECKSUM else None
+
+    codec = get_compression_codec(compression_mode)
+    sink = _PackSink(codec.compressobj(compression_level), base64_output, timings, payload_checksum)
+    sink.write_uncompressed(resource_header.to_bytes())
+
+    def encode_frame(index):
+        encode_start = time.perf_counter()
+        data = image_to_bytes(images[index], format, profile)
+        return data, time.perf_counter() - encode_start
+
+    record_checksum_mode = checksum_mode if resource_header.record_checksums else ChecksumMode.NO_CHECKSUM
+    writer = BytesWithHeadersWriter(sink, serialization_format, record_checksum_mode)
+    for data, encode_time in parallel_imap(encode_frame, range(images.shape[0]), resolve_workers(workers, images.shape[0])):
+        timings["encode"] += encode_time
+
+        # Writing a record also runs the downstream stages, which track their own time
+        downstream_time = timings["compress"] + timings["checksum"] + timings["base64"]
+        frame_start = time.perf_counter()
+        writer.write(data)
+        timings["frame"] += time.perf_counter() - frame_start - (timings["compress"] + timings["checksum"] + timings["base64"] - downstream_time)
+
+    writer.finish()
+    sink.finish()
+
+    timings["total"] = time.perf_counter() - start_time
+    return sink.buffer, writer.count, timings
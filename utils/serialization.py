@@ -2,51 +2,154 @@
 Serialization utilities for byte stream operations.
 """
 
+import bz2
+import lzma
 import struct
+import zlib
+from array import array
 from enum import StrEnum
 from .format import all_resource_formats
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 class SerializationFormat(StrEnum):
     """Enumeration for serialization data formats."""
     NONE = "none"  # No special format
     BYTES_WITH_HEADERS = "bytes_with_headers"  # Data is bytes stream array format with size headers
+    INDEXED_BYTES_WITH_HEADERS = "indexed_bytes_with_headers"  # Bytes with headers followed by a seekable offset index
+    VARINT_BYTES_WITH_HEADERS = "varint_bytes_with_headers"  # Bytes stream array format with LEB128 varint size headers
 
 
 class CompressionMode(StrEnum):
     """Enumeration for compression modes."""
     NO_COMPRESSION = "no_compression"  # No compression
     ZLIB_COMPRESSION = "zlib_compression"  # Zlib compression
+    LZMA_COMPRESSION = "lzma_compression"  # LZMA (xz) compression
+    BZ2_COMPRESSION = "bz2_compression"  # Bzip2 compression
+    ZSTD_COMPRESSION = "zstd_compression"  # Zstandard compression (requires zstandard)
+    LZ4_COMPRESSION = "lz4_compression"  # LZ4 frame compression (requires lz4)
+
+serialization_formats = [SerializationFormat.NONE, SerializationFormat.BYTES_WITH_HEADERS, SerializationFormat.INDEXED_BYTES_WITH_HEADERS, SerializationFormat.VARINT_BYTES_WITH_HEADERS]
+bytes_array_formats = [SerializationFormat.BYTES_WITH_HEADERS, SerializationFormat.INDEXED_BYTES_WITH_HEADERS, SerializationFormat.VARINT_BYTES_WITH_HEADERS]
+
+
+class ChecksumMode(StrEnum):
+    """Enumeration for integrity checksum algorithms."""
+    NO_CHECKSUM = "no_checksum"  # No checksum
+    CRC32 = "crc32"  # 4-byte big-endian CRC32
+    XXHASH64 = "xxhash64"  # 8-byte big-endian xxHash64 (requires xxhash)
+
+# Index in this list is the stable header ID, only append new modes
+checksum_modes = [ChecksumMode.NO_CHECKSUM, ChecksumMode.CRC32, ChecksumMode.XXHASH64]
+available_checksum_modes = [mode for mode in checksum_modes if mode != ChecksumMode.XXHASH64 or xxhash is not None]
 
-serialization_formats = [SerializationFormat.NONE, SerializationFormat.BYTES_WITH_HEADERS]
-compression_modes = [CompressionMode.NO_COMPRESSION, CompressionMode.ZLIB_COMPRESSION]
+# Index in this list is the stable header ID, only append new modes
+compression_modes = [CompressionMode.NO_COMPRESSION, CompressionMode.ZLIB_COMPRESSION, CompressionMode.LZMA_COMPRESSION,
+                     CompressionMode.BZ2_COMPRESSION, CompressionMode.ZSTD_COMPRESSION, CompressionMode.LZ4_COMPRESSION]
 
 RESOURCE_HEADER_SIZE = 4
 
+# Byte 3 of the ResourceHeader: low nibble is the checksum mode index, this bit flags per-record checksums
+RECORD_CHECKSUMS_FLAG = 0x10
+
+
+class _Crc32Checksum:
+    """Incremental CRC32 with the hashlib update()/digest() interface."""
+
+    def __init__(self):
+        self._value = 0
+
+    def update(self, data):
+        self._value = zlib.crc32(data, self._value)
+
+    def digest(self) -> bytes:
+        return self._value.to_bytes(4, byteorder='big')
+
+
+def checksum_size(checksum_mode: ChecksumMode) -> int:
+    """Get the digest size in bytes of a checksum mode (0 for no checksum)."""
+    return {ChecksumMode.NO_CHECKSUM: 0, ChecksumMode.CRC32: 4, ChecksumMode.XXHASH64: 8}[ChecksumMode(checksum_mode)]
+
+
+def new_checksum(checksum_mode: ChecksumMode):
+    """
+    Create an incremental checksum object.
+
+    Args:
+        checksum_mode: Checksum algorithm (not NO_CHECKSUM)
+
+    Returns:
+        Object with update(data) and digest() -> big-endian bytes
+
+    Raises:
+        ValueError: If the checksum mode is unknown or its package is not installed
+    """
+    if checksum_mode == ChecksumMode.CRC32:
+        return _Crc32Checksum()
+    if checksum_mode == ChecksumMode.XXHASH64:
+        if xxhash is None:
+            raise ValueError(f"Checksum mode {checksum_mode} is not available, install xxhash")
+        return xxhash.xxh64()
+    raise ValueError(f"Invalid checksum mode: {checksum_mode}")
+
+
+def compute_checksum(checksum_mode: ChecksumMode, data) -> bytes:
+    """Compute the checksum digest of data in one call."""
+    checksum = new_checksum(checksum_mode)
+    checksum.update(data)
+    return checksum.digest()
+
+
 class ResourceHeader:
     """
     Resource header structure for serialized resources.
 
     Fixed 4-byte structure:
     - Byte 0: Resource format number (0-255)
-    - Byte 1: Compression mode (0=no compression, 1=zlib compression)
-    - Byte 2: Serialization format (0=none, 1=bytes_with_headers)
-    - Byte 3: Reserved for future use
+    - Byte 1: Compression mode (0=no compression, 1=zlib, 2=lzma, 3=bz2, 4=zstd, 5=lz4)
+    - Byte 2: Serialization format (0=none, 1=bytes_with_headers, 2=indexed_bytes_with_headers, 3=varint_bytes_with_headers)
+    - Byte 3: Checksum flags, bits 0-3 = checksum mode (0=none, 1=crc32, 2=xxhash64),
+      bit 4 = per-record checksums, other bits reserved (0)
+
+    With a checksum mode, the payload (after the header, as stored) is followed by its checksum,
+    so corruption is detected before decompression. With per-record checksums, every record of a
+    bytes array format is also followed by the checksum of its data.
 
     Serialization formats:
     - NONE: Standard single data stream
     - BYTES_WITH_HEADERS: Data is a concatenated array of byte streams, each preceded by a 4-byte big-endian size header
+    - INDEXED_BYTES_WITH_HEADERS: BYTES_WITH_HEADERS followed by a footer index of 8-byte big-endian record offsets,
+      an 8-byte big-endian record count and the 4-byte magic b"ETIX"
+    - VARINT_BYTES_WITH_HEADERS: Like BYTES_WITH_HEADERS, but each size header is an unsigned LEB128 varint
+      (no 4 GiB record limit, 1 byte for records under 128 bytes)
     """
 
 
-    def __init__(self, format_number: int = 0, compression_mode: CompressionMode = CompressionMode.NO_COMPRESSION, serialization_format: SerializationFormat = SerializationFormat.NONE):
+    def __init__(self, format_number: int = 0, compression_mode: CompressionMode = CompressionMode.NO_COMPRESSION, serialization_format: SerializationFormat = SerializationFormat.NONE,
+                 checksum_mode: ChecksumMode = ChecksumMode.NO_CHECKSUM, record_checksums: bool = False):
         """
-        Initialize ResourceHeader with format number, compression mode, and serialization format.
+        Initialize ResourceHeader with format number, compression mode, serialization format and checksum flags.
 
         Args:
             format_number: Resource format number (0-{max_format}), where 0=application/octet-stream
             compression_mode: Compression mode enum
             serialization_format: Serialization format enum
+            checksum_mode: Checksum mode enum for the payload (and records)
+            record_checksums: Whether every record of a bytes array format carries a checksum
         """
         max_format = len(all_resource_formats)
         if not (0 <= format_number <= max_format):
@@ -55,6 +158,8 @@ class ResourceHeader:
         self.format_number = format_number
         self.compression_mode = compression_mode
         self.serialization_format = serialization_format
+        self.checksum_mode = checksum_mode
+        self.record_checksums = record_checksums and checksum_mode != ChecksumMode.NO_CHECKSUM
         self.mime_type = all_resource_formats[format_number - 1] if format_number > 0 else "application/octet-stream"
 
     def to_bytes(self) -> bytes:
@@ -83,12 +188,20 @@ class ResourceHeader:
         except ValueError:
             raise ValueError(f"Invalid serialization format: {self.serialization_format}")
 
-        # Pack into 4 bytes: format_number, compression_mode, serialization_format, reserved
+        # Convert checksum mode enum to index and add the per-record flag
+        try:
+            checksum_flags = checksum_modes.index(self.checksum_mode)
+        except ValueError:
+            raise ValueError(f"Invalid checksum mode: {self.checksum_mode}")
+        if self.record_checksums:
+            checksum_flags |= RECORD_CHECKSUMS_FLAG
+
+        # Pack into 4 bytes: format_number, compression_mode, serialization_format, checksum flags
         return struct.pack('BBBB',
                           self.format_number,
                           compression_index,
                           serialization_index,
-                          0)  # reserved byte
+                          checksum_flags)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> 'ResourceHeader':
@@ -107,8 +220,8 @@ class ResourceHeader:
         if len(data) != RESOURCE_HEADER_SIZE:
             raise ValueError(f"ResourceHeader data must be exactly {RESOURCE_HEADER_SIZE} bytes, got {len(data)} bytes")
 
-        # Unpack bytes: format_number, compression_mode_index, serialization_format_index, reserved
-        format_number, compression_mode_index, serialization_format_index, _ = struct.unpack('BBBB', data)
+        # Unpack bytes: format_number, compression_mode_index, serialization_format_index, checksum flags
+        format_number, compression_mode_index, serialization_format_index, checksum_flags = struct.unpack('BBBB', data)
 
         # Convert indices back to enum types
         try:
@@ -121,10 +234,16 @@ class ResourceHeader:
         except IndexError:
             raise ValueError(f"Invalid serialization format index: {serialization_format_index}")
 
-        return cls(format_number, compression_mode, serialization_format)
+        checksum_mode_index = checksum_flags & 0x0F
+        if checksum_mode_index >= len(checksum_modes) or checksum_flags & ~(0x0F | RECORD_CHECKSUMS_FLAG):
+            raise ValueError(f"Invalid checksum flags: {checksum_flags:#04x}")
+
+        return cls(format_number, compression_mode, serialization_format,
+                   checksum_modes[checksum_mode_index], bool(checksum_flags & RECORD_CHECKSUMS_FLAG))
 
     @classmethod
-    def from_mime_type(cls, mime_type: str, compression_mode: CompressionMode = CompressionMode.NO_COMPRESSION, serialization_format: SerializationFormat = SerializationFormat.NONE) -> 'ResourceHeader':
+    def from_mime_type(cls, mime_type: str, compression_mode: CompressionMode = CompressionMode.NO_COMPRESSION, serialization_format: SerializationFormat = SerializationFormat.NONE,
+                       checksum_mode: ChecksumMode = ChecksumMode.NO_CHECKSUM, record_checksums: bool = False) -> 'ResourceHeader':
         """
         Create ResourceHeader from MIME type.
 
@@ -132,6 +251,8 @@ class ResourceHeader:
             mime_type: MIME type string
             compression_mode: Compression mode enum
             serialization_format: Serialization format enum
+            checksum_mode: Checksum mode enum for the payload (and records)
+            record_checksums: Whether every record of a bytes array format carries a checksum
 
         Returns:
             ResourceHeader: Header object with corresponding format number
@@ -144,11 +265,11 @@ class ResourceHeader:
         except ValueError:
             raise ValueError(f"Unsupported MIME type: {mime_type}")
 
-        return cls(format_number, compression_mode, serialization_format)
+        return cls(format_number, compression_mode, serialization_format, checksum_mode, record_checksums)
 
     def __repr__(self) -> str:
         """Return string representation of ResourceHeader."""
-        return f"ResourceHeader(format_number={self.format_number}, mime_type='{self.mime_type}', compression_mode={self.compression_mode}, serialization_format={self.serialization_format})"
+        return f"ResourceHeader(format_number={self.format_number}, mime_type='{self.mime_type}', compression_mode={self.compression_mode}, serialization_format={self.serialization_format}, checksum_mode={self.checksum_mode}, record_checksums={self.record_checksums})"
 
     def __eq__(self, other) -> bool:
         """Check equality with another ResourceHeader."""
@@ -157,9 +278,414 @@ class ResourceHeader:
         return (self.format_number == other.format_number and
                 self.compression_mode == other.compression_mode and
                 self.serialization_format == other.serialization_format and
+                self.checksum_mode == other.checksum_mode and
+                self.record_checksums == other.record_checksums and
                 self.mime_type == other.mime_type)
 
 
+class _PassthroughCompressor:
+    """Streaming (de)compressor that returns data unchanged."""
+
+    def compress(self, data):
+        return bytes(data)
+
+    def decompress(self, data):
+        return bytes(data)
+
+    def flush(self):
+        return b""
+
+
+class _FlushlessDecompressor:
+    """Adds a no-op flush() to decompressors that don't buffer output."""
+
+    def __init__(self, decompressor):
+        self._decompressor = decompressor
+
+    def decompress(self, data):
+        return self._decompressor.decompress(data)
+
+    def flush(self):
+        return b""
+
+
+class _Lz4Compressor:
+    """Streaming LZ4 frame compressor that writes the frame header with the first output."""
+
+    def __init__(self, level):
+        self._compressor = lz4_frame.LZ4FrameCompressor(compression_level=level)
+        self._header = self._compressor.begin()
+
+    def compress(self, data):
+        output = self._header + self._compressor.compress(data)
+        self._header = b""
+        return output
+
+    def flush(self):
+        output = self._header + self._compressor.flush()
+        self._header = b""
+        return output
+
+
+class CompressionCodec:
+    """
+    Compression codec registered behind a CompressionMode.
+
+    Streaming objects share one interface: compressors have compress(data)
+    and flush(), decompressors have decompress(data) and flush().
+    """
+
+    def __init__(self, mode: CompressionMode, min_level: int, max_level: int, default_level: int,
+                 compressor_factory, decompressor_factory, available: bool = True):
+        """
+        Initialize CompressionCodec.
+
+        Args:
+            mode: Compression mode enum, its index in compression_modes is the header ID
+            min_level: Minimum compression level
+            max_level: Maximum compression level
+            default_level: Compression level used when none is given
+            compressor_factory: Callable taking a level and returning a streaming compressor
+            decompressor_factory: Callable returning a streaming decompressor
+            available: Whether the backing module is importable
+        """
+        self.mode = mode
+        self.header_id = compression_modes.index(mode)
+        self.min_level = min_level
+        self.max_level = max_level
+        self.default_level = default_level
+        self.available = available
+        self._compressor_factory = compressor_factory
+        self._decompressor_factory = decompressor_factory
+
+    def _check_available(self):
+        if not self.available:
+            raise ValueError(f"Compression mode {self.mode} is not available, install its Python package")
+
+    def compressobj(self, level: int = None):
+        """
+        Create a streaming compressor.
+
+        Args:
+            level: Compression level (None = codec default), clamped to the codec range
+
+        Returns:
+            Streaming compressor with compress(data) and flush()
+        """
+        self._check_available()
+        if level is None:
+            level = self.default_level
+        return self._compressor_factory(min(max(level, self.min_level), self.max_level))
+
+    def decompressobj(self):
+        """
+        Create a streaming decompressor.
+
+        Returns:
+            Streaming decompressor with decompress(data) and flush()
+        """
+        self._check_available()
+        return self._decompressor_factory()
+
+    def compress(self, data, level: int = None) -> bytes:
+        """Compress data in one call."""
+        compressor = self.compressobj(level)
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data) -> bytes:
+        """Decompress data in one call."""
+        decompressor = self.decompressobj()
+        return decompressor.decompress(data) + decompressor.flush()
+
+    def __repr__(self) -> str:
+        return f"CompressionCodec(mode={self.mode}, header_id={self.header_id}, levels={self.min_level}..{self.max_level}, available={self.available})"
+
+
+compression_codecs = {
+    CompressionMode.NO_COMPRESSION: CompressionCodec(
+        CompressionMode.NO_COMPRESSION, 0, 0, 0,
+        lambda level: _PassthroughCompressor(), _PassthroughCompressor),
+    CompressionMode.ZLIB_COMPRESSION: CompressionCodec(
+        CompressionMode.ZLIB_COMPRESSION, -1, 9, -1,
+        lambda level: zlib.compressobj(level), zlib.decompressobj),
+    CompressionMode.LZMA_COMPRESSION: CompressionCodec(
+        CompressionMode.LZMA_COMPRESSION, 0, 9, 6,
+        lambda level: lzma.LZMACompressor(preset=level), lambda: _FlushlessDecompressor(lzma.LZMADecompressor())),
+    CompressionMode.BZ2_COMPRESSION: CompressionCodec(
+        CompressionMode.BZ2_COMPRESSION, 1, 9, 9,
+        lambda level: bz2.BZ2Compressor(level), lambda: _FlushlessDecompressor(bz2.BZ2Decompressor())),
+    CompressionMode.ZSTD_COMPRESSION: CompressionCodec(
+        CompressionMode.ZSTD_COMPRESSION, 1, 22, 3,
+        lambda level: zstandard.ZstdCompressor(level=level).compressobj(),
+        lambda: _FlushlessDecompressor(zstandard.ZstdDecompressor().decompressobj()),
+        available=zstandard is not None),
+    CompressionMode.LZ4_COMPRESSION: CompressionCodec(
+        CompressionMode.LZ4_COMPRESSION, 0, 16, 0,
+        _Lz4Compressor, lambda: _FlushlessDecompressor(lz4_frame.LZ4FrameDecompressor()),
+        available=lz4_frame is not None),
+}
+
+# Compression modes whose backing module is importable
+available_compression_modes = [mode for mode in compression_modes if compression_codecs[mode].available]
+
+
+def get_compression_codec(compression_mode) -> CompressionCodec:
+    """
+    Get the codec registered for a compression mode or header ID.
+
+    Args:
+        compression_mode: Compression mode enum/string, or header ID
+
+    Returns:
+        CompressionCodec: Registered codec
+
+    Raises:
+        ValueError: If the compression mode is unknown
+    """
+    if isinstance(compression_mode, int):
+        if not 0 <= compression_mode < len(compression_modes):
+            raise ValueError(f"Invalid compression mode index: {compression_mode}")
+        compression_mode = compression_modes[compression_mode]
+
+    try:
+        return compression_codecs[CompressionMode(compression_mode)]
+    except ValueError:
+        raise ValueError(f"Invalid compression mode: {compression_mode}")
+
+
+BYTES_HEADER_SIZE = 4
+MAX_HEADER_DATA_SIZE = (1 << 32) - 1
+
+# Footer of indexed_bytes_with_headers: [8-byte offset]*count [8-byte count][magic]
+INDEX_MAGIC = b"ETIX"
+INDEX_TRAILER_SIZE = 8 + len(INDEX_MAGIC)
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Encode a non-negative integer as unsigned LEB128 varint.
+
+    Args:
+        value: Integer to encode
+
+    Returns:
+        bytes: Varint bytes, 7 bits per byte, least significant group first
+    """
+    if value < 0:
+        raise ValueError(f"Varint value must be non-negative, got {value}")
+
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_varint(data, offset: int = 0):
+    """
+    Decode an unsigned LEB128 varint.
+
+    Args:
+        data: Bytes-like object
+        offset: Position of the varint
+
+    Returns:
+        tuple: (value, offset after the varint), or (None, offset) if the varint is incomplete
+    """
+    value = 0
+    shift = 0
+    position = offset
+    while position < len(data):
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        position += 1
+        if byte < 0x80:
+            return value, position
+        shift += 7
+    return None, offset
+
+
+def _size_header(data_size: int, varint: bool) -> bytes:
+    """Encode a record size header as 4-byte big-endian or varint."""
+    if varint:
+        return encode_varint(data_size)
+    if data_size > MAX_HEADER_DATA_SIZE:
+        raise ValueError(f"Data too large for 4-byte size header: {data_size} bytes, use {SerializationFormat.VARINT_BYTES_WITH_HEADERS}")
+    return data_size.to_bytes(BYTES_HEADER_SIZE, byteorder='big')
+
+
+class BytesWithHeadersWriter:
+    """
+    Linear-time writer for the bytes_with_headers format.
+
+    Format: [4-byte size][data][4-byte size][data]...
+    Each size is stored as big-endian 32-bit integer.
+
+    Without a stream, written items are collected and joined into a single
+    preallocated bytearray by getvalue(). With a stream (file object with
+    write() or socket with sendall()), each item is sent as soon as it is written.
+
+    For indexed_bytes_with_headers the record offsets are appended as a footer
+    by getvalue(), or by finish() when streaming. For varint_bytes_with_headers
+    the size headers are LEB128 varints. With a checksum mode, every record is
+    followed by the checksum of its data: [size][data][checksum].
+    """
+
+    def __init__(self, stream=None, serialization_format: SerializationFormat = SerializationFormat.BYTES_WITH_HEADERS,
+                 checksum_mode: ChecksumMode = ChecksumMode.NO_CHECKSUM):
+        """
+        Initialize BytesWithHeadersWriter.
+
+        Args:
+            stream: Optional file object or socket to stream the output to
+            serialization_format: One of bytes_array_formats
+            checksum_mode: Per-record checksum mode
+
+        Raises:
+            ValueError: If serialization_format is not a bytes array format
+        """
+        if serialization_format not in bytes_array_formats:
+            raise ValueError(f"Unsupported bytes array format: {serialization_format}")
+
+        self.stream = stream
+        self.serialization_format = serialization_format
+        self.indexed = serialization_format == SerializationFormat.INDEXED_BYTES_WITH_HEADERS
+        self.varint = serialization_format == SerializationFormat.VARINT_BYTES_WITH_HEADERS
+        self.checksum_mode = checksum_mode
+        self.count = 0
+        self.size = 0
+        self._items = []
+        self._headers = []
+        self._checksums = []
+        self._offsets = array("Q")
+        if stream is not None:
+            self._send = getattr(stream, "sendall", None) or stream.write
+
+    def write(self, data_bytes):
+        """
+        Write one bytes object with its size header.
+
+        Args:
+            data_bytes: Bytes-like object to write
+
+        Raises:
+            ValueError: If the data is too large for a 4-byte size header
+        """
+        data_size = len(data_bytes)
+        header = _size_header(data_size, self.varint)
+        checksum = compute_checksum(self.checksum_mode, data_bytes) if self.checksum_mode != ChecksumMode.NO_CHECKSUM else b""
+
+        if self.stream is None:
+            self._items.append(data_bytes)
+            self._headers.append(header)
+            self._checksums.append(checksum)
+        else:
+            self._send(header)
+            self._send(data_bytes)
+            if checksum:
+                self._send(checksum)
+
+        self._offsets.append(self.size)
+        self.count += 1
+        self.size += len(header) + data_size + len(checksum)
+
+    def write_all(self, bytes_list):
+        """
+        Write a list of bytes objects.
+
+        Args:
+            bytes_list: Iterable of bytes-like objects
+        """
+        for data_bytes in bytes_list:
+            self.write(data_bytes)
+
+    def footer(self) -> bytes:
+        """
+        Build the footer index for the records written so far.
+
+        Returns:
+            bytes: Footer index, empty when the writer is not indexed
+        """
+        if not self.indexed:
+            return b""
+        return struct.pack(f">{self.count}QQ", *self._offsets, self.count) + INDEX_MAGIC
+
+    def finish(self):
+        """Write the footer index to the stream."""
+        if self.stream is not None and self.indexed:
+            self._send(self.footer())
+
+    def getvalue(self) -> bytearray:
+        """
+        Build the merged output (and footer index) in a single preallocated buffer.
+
+        Returns:
+            bytearray: Merged bytes with size headers
+
+        Raises:
+            ValueError: If the writer streams to an output
+        """
+        if self.stream is not None:
+            raise ValueError("getvalue() is not available when streaming to an output")
+
+        footer = self.footer()
+        merged_bytes = bytearray(self.size + len(footer))
+        merged_bytes[self.size:] = footer
+        offset = 0
+        for header, data_bytes, checksum in zip(self._headers, self._items, self._checksums):
+            merged_bytes[offset:offset + len(header)] = header
+            offset += len(header)
+            merged_bytes[offset:offset + len(data_bytes)] = data_bytes
+            offset += len(data_bytes)
+            merged_bytes[offset:offset + len(checksum)] = checksum
+            offset += len(checksum)
+
+        return merged_bytes
+
+
+def parse_record_indices(indices: str, count: int, start: int = 0, end: int = -1):
+    """
+    Resolve a record selection to a list of record indices.
+
+    Args:
+        indices: Comma separated indices and inclusive ranges, e.g. "0, 5, 10-12" (negative indices count from the end)
+        count: Number of records available
+        start: First record of the range, used when indices is empty
+        end: End of the range (exclusive, -1 = up to the last record), used when indices is empty
+
+    Returns:
+        list: Selected record indices
+
+    Raises:
+        ValueError: If an index is malformed or out of range
+    """
+    if not indices.strip():
+        end = count if end < 0 else min(end, count)
+        return list(range(min(start, end), end))
+
+    def resolve(token):
+        index = int(token)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise ValueError(f"Record index out of range: {token} (count: {count})")
+        return index
+
+    selected = []
+    for part in indices.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, separator, last = part.partition("-") if not part.startswith("-") else (part, "", "")
+        if separator:
+            selected.extend(range(resolve(first), resolve(last) + 1))
+        else:
+            selected.append(resolve(first))
+
+    return selected
+
+
 def merge_bytes_with_headers(bytes_list):
     """
     Merge a list of bytes objects into a single bytes object with size headers.
@@ -171,17 +697,282 @@ def merge_bytes_with_headers(bytes_list):
         bytes_list: List of bytes objects to merge
 
     Returns:
-        bytes: Merged bytes object with size headers
+        bytearray: Merged bytes object with size headers
+    """
+    writer = BytesWithHeadersWriter()
+    writer.write_all(bytes_list)
+    return writer.getvalue()
+
+
+class BytesWithHeadersReader:
+    """
+    Zero-copy indexed reader for the bytes_with_headers format.
+
+    A single pass over the buffer builds an offset index; records are then
+    returned as memoryview slices of the original buffer without copying.
+    Incomplete trailing data is not dropped silently but reported through
+    truncated_bytes.
+
+    For the indexed_bytes_with_headers format the footer index is used
+    instead, so opening the reader and accessing record k are both O(1).
+    The varint_bytes_with_headers format is scanned like bytes_with_headers.
+
+    With a checksum mode, every record is verified as it is accessed, and
+    verify() checks all records before any decoding starts.
+    """
+
+    def __init__(self, data, serialization_format: SerializationFormat = SerializationFormat.BYTES_WITH_HEADERS,
+                 checksum_mode: ChecksumMode = ChecksumMode.NO_CHECKSUM):
+        """
+        Initialize BytesWithHeadersReader and build the record index.
+
+        Args:
+            data: Bytes-like object in one of bytes_array_formats
+            serialization_format: Format of data
+            checksum_mode: Per-record checksum mode of data
+
+        Raises:
+            ValueError: If serialization_format is not a bytes array format, or the footer index of indexed data is missing or corrupt
+        """
+        if serialization_format not in bytes_array_formats:
+            raise ValueError(f"Unsupported bytes array format: {serialization_format}")
+
+        self._view = memoryview(data).cast("B")
+        self.serialization_format = serialization_format
+        self.indexed = serialization_format == SerializationFormat.INDEXED_BYTES_WITH_HEADERS
+        self.varint = serialization_format == SerializationFormat.VARINT_BYTES_WITH_HEADERS
+        self.checksum_mode = checksum_mode
+        self._checksum_size = checksum_size(checksum_mode)
+        self.truncated_bytes = 0
+
+        if self.indexed:
+            self._read_footer()
+        else:
+            self._scan()
+            if serialization_format == SerializationFormat.BYTES_WITH_HEADERS and self._has_index_footer():
+                raise ValueError("Data carries an indexed_bytes_with_headers index footer, "
+                                 f"read it as {SerializationFormat.INDEXED_BYTES_WITH_HEADERS.value}")
+
+    def _scan(self):
+        """Build the offset index with a single pass over the records."""
+        self._offsets = array("Q")
+        self._sizes = array("Q")
+
+        offset = 0
+        total_length = len(self._view)
+        while offset < total_length:
+            if self.varint:
+                data_size, data_start = decode_varint(self._view, offset)
+                if data_size is None:
+                    break
+            else:
+                if offset + BYTES_HEADER_SIZE > total_length:
+                    break
+                data_size = int.from_bytes(self._view[offset:offset + BYTES_HEADER_SIZE], byteorder='big')
+                data_start = offset + BYTES_HEADER_SIZE
+
+            if data_start + data_size + self._checksum_size > total_length:
+                break
+            self._offsets.append(data_start)
+            self._sizes.append(data_size)
+            offset = data_start + data_size + self._checksum_size
+
+        self._count = len(self._offsets)
+        self.truncated_bytes = total_length - offset
+
+    def _has_index_footer(self) -> bool:
+        """Check whether scanned bytes_with_headers data actually ends with a matching index footer."""
+        total_length = len(self._view)
+        if total_length < INDEX_TRAILER_SIZE or self._view[total_length - len(INDEX_MAGIC):] != INDEX_MAGIC:
+            return False
+
+        (count,) = struct.unpack_from(">Q", self._view, total_length - INDEX_TRAILER_SIZE)
+        table_offset = total_length - INDEX_TRAILER_SIZE - count * 8
+        if table_offset < 0 or count > self._count:
+            return False
+
+        # A real footer lists exactly the records that end where the table starts
+        record_end = self._offsets[count - 1] + self._sizes[count - 1] + self._checksum_size if count else 0
+        if record_end != table_offset:
+            return False
+        table = struct.unpack_from(f">{count}Q", self._view, table_offset)
+        return all(table[index] == self._offsets[index] - BYTES_HEADER_SIZE for index in range(count))
+
+    def _read_footer(self):
+        """Locate the footer index without touching the records."""
+        total_length = len(self._view)
+        if total_length < INDEX_TRAILER_SIZE or self._view[total_length - len(INDEX_MAGIC):] != INDEX_MAGIC:
+            raise ValueError("Missing index footer in indexed_bytes_with_headers data")
+
+        (count,) = struct.unpack_from(">Q", self._view, total_length - INDEX_TRAILER_SIZE)
+        table_offset = total_length - INDEX_TRAILER_SIZE - count * 8
+        if table_offset < 0:
+            raise ValueError(f"Invalid record count in index footer: {count}")
+
+        self._count = count
+        self._table_offset = table_offset
+
+    def _record_span(self, index):
+        """Get (start, size) of the data of record index."""
+        if not self.indexed:
+            return self._offsets[index], self._sizes[index]
+
+        (offset,) = struct.unpack_from(">Q", self._view, self._table_offset + index * 8)
+        if offset + BYTES_HEADER_SIZE > self._table_offset:
+            raise ValueError(f"Invalid offset for record {index}: {offset}")
+
+        data_size = int.from_bytes(self._view[offset:offset + BYTES_HEADER_SIZE], byteorder='big')
+        start = offset + BYTES_HEADER_SIZE
+        if start + data_size + self._checksum_size > self._table_offset:
+            raise ValueError(f"Record {index} overruns the index footer")
+        return start, data_size
+
+    def _record(self, index):
+        """Get the data view of record index, verifying its checksum."""
+        start, data_size = self._record_span(index)
+        record = self._view[start:start + data_size]
+        if self._checksum_size:
+            expected = self._view[start + data_size:start + data_size + self._checksum_size]
+            if compute_checksum(self.checksum_mode, record) != expected:
+                raise ValueError(f"Checksum mismatch in record {index}")
+        return record
+
+    def verify(self):
+        """
+        Verify the checksums of all records.
+
+        Raises:
+            ValueError: If a record checksum does not match
+        """
+        for index in range(self._count):
+            self._record(index)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the buffer ends with an incomplete record."""
+        return self.truncated_bytes > 0
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        """
+        Get record views by index or slice.
+
+        Args:
+            index: Record index or slice
+
+        Returns:
+            memoryview of the record, or list of memoryviews for a slice
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Record index out of range: {index}")
+
+        return self._record(index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._record(index)
+
+    def release(self):
+        """Release the underlying memoryview."""
+        self._view.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+# Reference table record of deduplicated frame batches: [magic][frame count][unique count][frame -> unique index]*frame count
+DEDUP_TABLE_MAGIC = b"ETDD"
+_DEDUP_TABLE_HEADER = struct.Struct("<4sII")
+
+
+def dedup_reference_table(frame_map, unique_count: int) -> bytes:
+    """
+    Build the reference table record of a deduplicated frame batch.
+
+    Args:
+        frame_map: Unique record index of every frame, in frame order
+        unique_count: Number of unique records following the table
+
+    Returns:
+        bytes: Reference table record (little-endian 32-bit fields)
+    """
+    return _DEDUP_TABLE_HEADER.pack(DEDUP_TABLE_MAGIC, len(frame_map), unique_count) + struct.pack(f"<{len(frame_map)}I", *frame_map)
+
+
+def is_dedup_reference_table(data) -> bool:
+    """Check whether a record is a dedup reference table (encoded images never start with its magic)."""
+    return bytes(data[:len(DEDUP_TABLE_MAGIC)]) == DEDUP_TABLE_MAGIC
+
+
+def parse_dedup_reference_table(data, record_count: int = None) -> list:
     """
-    merged_bytes = b""
+    Parse the reference table record of a deduplicated frame batch.
 
-    for data_bytes in bytes_list:
-        # Convert size to 4-byte big-endian
-        size_bytes = len(data_bytes).to_bytes(4, byteorder='big')
-        # Append size header and data
-        merged_bytes += size_bytes + data_bytes
+    Args:
+        data: Reference table record
+        record_count: Optional number of unique records available, used for validation
+
+    Returns:
+        list: Unique record index of every frame
 
-    return merged_bytes
+    Raises:
+        ValueError: If the table is malformed or references missing records
+    """
+    if len(data) < _DEDUP_TABLE_HEADER.size or not is_dedup_reference_table(data):
+        raise ValueError("Record is not a dedup reference table")
+
+    _, frame_count, unique_count = _DEDUP_TABLE_HEADER.unpack_from(data)
+    if len(data) != _DEDUP_TABLE_HEADER.size + frame_count * 4:
+        raise ValueError(f"Dedup reference table size does not match its frame count {frame_count}")
+    if record_count is not None and unique_count > record_count:
+        raise ValueError(f"Dedup reference table expects {unique_count} unique records, only {record_count} available")
+
+    frame_map = list(struct.unpack_from(f"<{frame_count}I", data, _DEDUP_TABLE_HEADER.size))
+    if frame_map and max(frame_map) >= unique_count:
+        raise ValueError(f"Dedup reference table references record {max(frame_map)} of {unique_count}")
+    return frame_map
+
+
+def select_frame_records(records, indices: str = "", start: int = 0, end: int = -1):
+    """
+    Resolve a frame selection to the records that have to be decoded.
+
+    Handles both plain frame records and deduplicated batches (leading
+    reference table): every unique record needed by the selection is
+    returned once, together with the map that expands the decoded records
+    back into the selected frames (see utils.image.expand_frames).
+
+    Args:
+        records: Sequence of records, e.g. a BytesWithHeadersReader or list
+        indices: Frame selection, see parse_record_indices (empty = use start/end)
+        start: First frame of the range, used when indices is empty
+        end: End of the range (exclusive, -1 = up to the last frame), used when indices is empty
+
+    Returns:
+        tuple: (records to decode, frame map or None for plain batches, selected frame count)
+
+    Raises:
+        ValueError: If the selection or the reference table is invalid
+    """
+    if len(records) > 0 and is_dedup_reference_table(records[0]):
+        table = parse_dedup_reference_table(records[0], len(records) - 1)
+        frames = parse_record_indices(indices, len(table), start, end)
+        needed = sorted(set(table[frame] for frame in frames))
+        positions = {unique: position for position, unique in enumerate(needed)}
+        return [records[1 + unique] for unique in needed], [positions[table[frame]] for frame in frames], len(frames)
+
+    selected = [records[index] for index in parse_record_indices(indices, len(records), start, end)]
+    return selected, None, len(selected)
 
 
 def split_bytes_with_headers(merged_bytes):
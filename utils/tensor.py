@@ -0,0 +1,406 @@
+"""
+Raw tensor wire format.
+
+Layout (all integers little-endian):
+- Bytes 0-3: Magic b"ETRT"
+- Byte 4: Format version
+- Byte 5: Data type code
+- Byte 6: Number of dimensions
+- Byte 7: Reserved
+- Next ndim * 8 bytes: Shape, unsigned 64-bit per dimension
+- Zero padding up to a 16-byte boundary
+- Tensor data, C-contiguous in native (little-endian) byte order
+"""
+
+import struct
+import sys
+
+import torch
+
+RAW_TENSOR_MAGIC = b"ETRT"
+RAW_TENSOR_VERSION = 1
+RAW_TENSOR_ALIGNMENT = 16
+
+_RAW_TENSOR_PREFIX = struct.Struct("<4sBBBB")
+
+# Stable data type codes, never reorder
+_DTYPE_CODES = {
+    torch.float32: 1,
+    torch.float16: 2,
+    torch.bfloat16: 3,
+    torch.float64: 4,
+    torch.uint8: 5,
+    torch.int8: 6,
+    torch.int16: 7,
+    torch.int32: 8,
+    torch.int64: 9,
+    torch.bool: 10,
+}
+_CODE_DTYPES = {code: dtype for dtype, code in _DTYPE_CODES.items()}
+
+
+def _align(offset: int) -> int:
+    """Round offset up to the data alignment."""
+    return (offset + RAW_TENSOR_ALIGNMENT - 1) // RAW_TENSOR_ALIGNMENT * RAW_TENSOR_ALIGNMENT
+
+
+def _check_byteorder():
+    """Raw tensor data is stored in little-endian byte order."""
+    if sys.byteorder != "little":
+        raise RuntimeError("Raw tensor format requires a little-endian platform")
+
+
+def raw_tensor_header(dtype: torch.dtype, shape) -> bytes:
+    """
+    Build raw tensor header including padding up to the data offset.
+
+    Args:
+        dtype: Tensor data type
+        shape: Tensor shape
+
+    Returns:
+        Header bytes
+
+    Raises:
+        ValueError: If dtype is not supported or tensor has too many dimensions
+    """
+    if dtype not in _DTYPE_CODES:
+        raise ValueError(f"Unsupported tensor dtype: {dtype}")
+    if len(shape) > 255:
+        raise ValueError(f"Tensor has too many dimensions: {len(shape)}")
+
+    header = _RAW_TENSOR_PREFIX.pack(RAW_TENSOR_MAGIC, RAW_TENSOR_VERSION, _DTYPE_CODES[dtype], len(shape), 0)
+    header += struct.pack(f"<{len(shape)}Q", *shape)
+    return header + b"\0" * (_align(len(header)) - len(header))
+
+
+def parse_raw_tensor_header(data, offset: int = 0):
+    """
+    Parse raw tensor header.
+
+    Args:
+        data: Bytes-like object containing a raw tensor
+        offset: Offset of the header within data
+
+    Returns:
+        Tuple of (dtype, shape, data_offset) where data_offset is absolute within data
+
+    Raises:
+        ValueError: If the header is invalid or truncated
+    """
+    if len(data) - offset < _RAW_TENSOR_PREFIX.size:
+        raise ValueError("Raw tensor data is too short for header")
+
+    magic, version, dtype_code, ndim, _ = _RAW_TENSOR_PREFIX.unpack_from(data, offset)
+    if magic != RAW_TENSOR_MAGIC:
+        raise ValueError("Data is not in raw tensor format")
+    if version != RAW_TENSOR_VERSION:
+        raise ValueError(f"Unsupported raw tensor format version: {version}")
+    if dtype_code not in _CODE_DTYPES:
+        raise ValueError(f"Invalid raw tensor dtype code: {dtype_code}")
+
+    shape_offset = offset + _RAW_TENSOR_PREFIX.size
+    if len(data) < shape_offset + ndim * 8:
+        raise ValueError("Raw tensor data is too short for shape")
+    shape = struct.unpack_from(f"<{ndim}Q", data, shape_offset)
+
+    data_offset = offset + _align(_RAW_TENSOR_PREFIX.size + ndim * 8)
+    return _CODE_DTYPES[dtype_code], tuple(shape), data_offset
+
+
+def is_raw_tensor(data) -> bool:
+    """Check whether bytes-like data starts with a raw tensor header."""
+    return len(data) >= len(RAW_TENSOR_MAGIC) and bytes(data[:len(RAW_TENSOR_MAGIC)]) == RAW_TENSOR_MAGIC
+
+
+def _tensor_nbytes(dtype: torch.dtype, shape) -> int:
+    """Return data size in bytes for dtype and shape."""
+    numel = 1
+    for dim in shape:
+        numel *= dim
+    return numel * torch.empty((), dtype=dtype).element_size()
+
+
+def tensor_to_raw_bytes(tensor) -> bytearray:
+    """
+    Serialize tensor to raw tensor format.
+
+    The output buffer is allocated once and the tensor data copied into it directly.
+
+    Args:
+        tensor: Tensor (or numpy array) to serialize
+
+    Returns:
+        bytearray with header and tensor data
+    """
+    _check_byteorder()
+
+    if isinstance(tensor, torch.Tensor):
+        tensor = tensor.detach().cpu()
+    else:
+        tensor = torch.from_numpy(tensor)
+    tensor = tensor.contiguous()
+
+    header = raw_tensor_header(tensor.dtype, tensor.shape)
+    nbytes = tensor.numel() * tensor.element_size()
+
+    buffer = bytearray(len(header) + nbytes)
+    buffer[:len(header)] = header
+    if nbytes > 0:
+        destination = torch.frombuffer(buffer, dtype=torch.uint8, offset=len(header), count=nbytes)
+        destination.copy_(tensor.reshape(-1).view(torch.uint8))
+
+    return buffer
+
+
+def raw_bytes_to_tensor(data, offset: int = 0) -> torch.Tensor:
+    """
+    Deserialize tensor from raw tensor format.
+
+    The returned tensor shares memory with data when data is writable
+    (bytearray, writable memoryview or mmap). Immutable data such as bytes is
+    copied once, so the tensor is always safe to modify in place.
+
+    Args:
+        data: Bytes-like object (bytes, bytearray, memoryview, mmap)
+        offset: Offset of the raw tensor within data
+
+    Returns:
+        Tensor view over data (or over a copy of read-only data)
+
+    Raises:
+        ValueError: If the data is invalid or truncated
+    """
+    _check_byteorder()
+
+    view = memoryview(data)
+    dtype, shape, data_offset = parse_raw_tensor_header(view, offset)
+    nbytes = _tensor_nbytes(dtype, shape)
+
+    if len(view) < data_offset + nbytes:
+        raise ValueError(f"Raw tensor data is truncated: expected {nbytes} bytes of tensor data")
+
+    if nbytes == 0:
+        return torch.empty(shape, dtype=dtype)
+
+    count = nbytes // torch.empty((), dtype=dtype).element_size()
+    if view.readonly:
+        # Tensors must never alias immutable memory such as bytes, copy the data once
+        view = memoryview(bytearray(view[data_offset:data_offset + nbytes]))
+        data_offset = 0
+    tensor = torch.frombuffer(view, dtype=dtype, count=count, offset=data_offset)
+
+    return tensor.reshape(shape)
+
+
+# Raw tensor batch container layout (all integers little-endian):
+# - Bytes 0-3: Magic b"ETRB"
+# - Byte 4: Format version
+# - Byte 5: Data type code
+# - Byte 6: Number of frame dimensions
+# - Byte 7: Reserved
+# - Next 8 bytes: Frame count
+# - Next ndim * 8 bytes: Frame shape
+# - Next (count + 1) * 8 bytes: Frame offsets relative to the data region, last entry is the data region size
+# - Zero padding up to a 16-byte boundary
+# - Data region, frames stored back to back
+RAW_TENSOR_BATCH_MAGIC = b"ETRB"
+RAW_TENSOR_BATCH_VERSION = 1
+
+_RAW_TENSOR_BATCH_PREFIX = struct.Struct("<4sBBBBQ")
+
+
+def _as_cpu_tensor(tensors):
+    """Convert tensor or numpy array to contiguous CPU tensor."""
+    if isinstance(tensors, torch.Tensor):
+        tensors = tensors.detach().cpu()
+    else:
+        tensors = torch.from_numpy(tensors)
+    return tensors.contiguous()
+
+
+def tensor_batch_container_header(dtype: torch.dtype, frame_shape, count: int) -> bytes:
+    """
+    Build batch container header, offset table and padding.
+
+    Args:
+        dtype: Frame data type
+        frame_shape: Shape of a single frame
+        count: Number of frames
+
+    Returns:
+        Header bytes, the data region starts right after them
+    """
+    if dtype not in _DTYPE_CODES:
+        raise ValueError(f"Unsupported tensor dtype: {dtype}")
+    if len(frame_shape) > 255:
+        raise ValueError(f"Frame has too many dimensions: {len(frame_shape)}")
+
+    frame_nbytes = _tensor_nbytes(dtype, frame_shape)
+    offsets = [i * frame_nbytes for i in range(count + 1)]
+
+    header = _RAW_TENSOR_BATCH_PREFIX.pack(RAW_TENSOR_BATCH_MAGIC, RAW_TENSOR_BATCH_VERSION, _DTYPE_CODES[dtype], len(frame_shape), 0, count)
+    header += struct.pack(f"<{len(frame_shape)}Q", *frame_shape)
+    header += struct.pack(f"<{count + 1}Q", *offsets)
+    return header + b"\0" * (_align(len(header)) - len(header))
+
+
+def write_tensor_batch_container(stream, tensors) -> int:
+    """
+    Write tensor batch container to a binary file object.
+
+    Args:
+        stream: Writable binary file object
+        tensors: Tensor batch, first dimension is the frame index
+
+    Returns:
+        Number of bytes written
+    """
+    _check_byteorder()
+    tensors = _as_cpu_tensor(tensors)
+
+    header = tensor_batch_container_header(tensors.dtype, tuple(tensors.shape[1:]), tensors.shape[0])
+    stream.write(header)
+    written = len(header)
+
+    for frame in tensors:
+        frame_bytes = frame.reshape(-1).view(torch.uint8).numpy()
+        stream.write(memoryview(frame_bytes))
+        written += frame_bytes.nbytes
+
+    return written
+
+
+class TensorBatchReader:
+    """
+    Random access reader for tensor batch containers.
+
+    Frames are returned as zero-copy tensor views over the backing buffer,
+    which can be bytes, bytearray, memoryview or a memory-mapped file.
+    Frames of immutable buffers (bytes) are copied on access instead.
+    """
+
+    def __init__(self, data):
+        """
+        Parse container header and offset table.
+
+        Args:
+            data: Bytes-like object holding the container
+
+        Raises:
+            ValueError: If the container is invalid or truncated
+        """
+        _check_byteorder()
+        self._mmap = None
+        self._view = memoryview(data)
+        view = self._view
+
+        if len(view) < _RAW_TENSOR_BATCH_PREFIX.size:
+            raise ValueError("Tensor batch container is too short for header")
+
+        magic, version, dtype_code, ndim, _, count = _RAW_TENSOR_BATCH_PREFIX.unpack_from(view, 0)
+        if magic != RAW_TENSOR_BATCH_MAGIC:
+            raise ValueError("Data is not a tensor batch container")
+        if version != RAW_TENSOR_BATCH_VERSION:
+            raise ValueError(f"Unsupported tensor batch container version: {version}")
+        if dtype_code not in _CODE_DTYPES:
+            raise ValueError(f"Invalid tensor batch dtype code: {dtype_code}")
+
+        offset = _RAW_TENSOR_BATCH_PREFIX.size
+        table_end = offset + ndim * 8 + (count + 1) * 8
+        if len(view) < table_end:
+            raise ValueError("Tensor batch container is truncated in offset table")
+
+        self.dtype = _CODE_DTYPES[dtype_code]
+        self.frame_shape = struct.unpack_from(f"<{ndim}Q", view, offset)
+        self.count = count
+        self._data_offset = _align(table_end)
+        self._element_size = torch.empty((), dtype=self.dtype).element_size()
+        self._frame_numel = _tensor_nbytes(self.dtype, self.frame_shape) // self._element_size
+        self._frame_nbytes = self._frame_numel * self._element_size
+
+        # Frames are fixed-size, offsets are computed; the stored table must agree entry for entry
+        expected_offsets = struct.pack(f"<{count + 1}Q", *(index * self._frame_nbytes for index in range(count + 1)))
+        if view[offset + ndim * 8:table_end] != expected_offsets:
+            raise ValueError("Tensor batch container offset table does not match the frame size")
+
+        data_size = count * self._frame_nbytes
+        if len(view) < self._data_offset + data_size:
+            raise ValueError(f"Tensor batch container is truncated: expected {data_size} bytes of frame data")
+
+    @classmethod
+    def open(cls, path: str) -> 'TensorBatchReader':
+        """
+        Open tensor batch container file as a memory map.
+
+        Pages are loaded on demand, so only the frames that are accessed are read from disk.
+        The mapping is copy-on-write: modifying returned tensors never changes the file.
+
+        Args:
+            path: Container file path
+
+        Returns:
+            TensorBatchReader backed by the memory-mapped file
+        """
+        import mmap
+
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        reader = cls(mapped)
+        reader._mmap = mapped
+        return reader
+
+    def close(self):
+        """Release the backing buffer. Raises BufferError while frame tensors returned earlier are still alive."""
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _frames(self, start: int, stop: int) -> torch.Tensor:
+        """Return zero-copy view over frames [start, stop)."""
+        frame_count = stop - start
+        if frame_count <= 0 or self._frame_numel == 0:
+            return torch.empty((max(frame_count, 0),) + tuple(self.frame_shape), dtype=self.dtype)
+
+        view = self._view
+        offset = self._data_offset + start * self._frame_nbytes
+        if view.readonly:
+            # Tensors must never alias immutable memory such as bytes, copy the selected frames
+            view = memoryview(bytearray(view[offset:offset + frame_count * self._frame_nbytes]))
+            offset = 0
+        tensor = torch.frombuffer(view, dtype=self.dtype, count=frame_count * self._frame_numel, offset=offset)
+        return tensor.reshape((frame_count,) + tuple(self.frame_shape))
+
+    def __getitem__(self, index):
+        """
+        Get frame by index (zero-copy frame view) or frames by contiguous slice (zero-copy batch view).
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            if step == 1:
+                return self._frames(start, stop)
+            # Non-contiguous selection has to be copied
+            indices = range(start, stop, step)
+            if len(indices) == 0:
+                return self._frames(0, 0)
+            return torch.stack([self[i] for i in indices])
+
+        if index < 0:
+            index += self.count
+        if not (0 <= index < self.count):
+            raise IndexError(f"Frame index {index} out of range for {self.count} frames")
+        return self._frames(index, index + 1)[0]
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
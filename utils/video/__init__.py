@@ -1,5 +1,7 @@
 try:
     from .ffmpeg import ffmpeg_path, FORMAT_MAPPING as FFMPEG_FORMAT_MAPPING, combine_video as ffmpeg_combine_video, load_video as ffmpeg_load_video
+    from .ffmpeg import LOSSLESS_FORMAT_MAPPING as FFMPEG_LOSSLESS_FORMAT_MAPPING
+    from .steganography import encode_steganography_video, decode_steganography_video, video_steganography_frame_count
     ffmpeg_available = ffmpeg_path is not None
 except ImportError:
     ffmpeg_available = False
@@ -3,6 +3,7 @@ import shutil
 import uuid
 import os
 import subprocess
+import tempfile
 import re
 import time
 import itertools
@@ -77,6 +78,32 @@ FORMAT_MAPPING = {
 }
 
 
+# Lossless RGB formats for carrying exact pixel data (not listed in FORMAT_MAPPING)
+FFV1_MKV = {
+    "main_pass": [
+        "-n", "-c:v", "ffv1",
+        "-level", "3",
+        "-pix_fmt", "bgr0"
+    ],
+    "extension": "mkv"
+}
+
+H264RGB_MKV = {
+    "main_pass": [
+        "-n", "-c:v", "libx264rgb",
+        "-preset", "ultrafast",
+        "-qp", "0",
+        "-pix_fmt", "rgb24"
+    ],
+    "extension": "mkv"
+}
+
+LOSSLESS_FORMAT_MAPPING = {
+    "ffv1-mkv": FFV1_MKV,
+    "h264rgb-mkv": H264RGB_MKV
+}
+
+
 def get_video_format(format_name: str):
     """
     Get video format configuration by name.
@@ -376,6 +403,129 @@ def _ffmpeg_frame_generator(video_path: str, force_rate: int = 0, frame_load_cap
         raise Exception("FFmpeg subprocess error:\n" + proc.stderr.read().decode(*ENCODE_ARGS))
 
 
+def write_raw_frames(
+    frames,
+    width: int,
+    height: int,
+    output_path: str,
+    frame_rate: int = 30,
+    video_format: str = "ffv1-mkv",
+    ffmpeg_bin: Optional[str] = None,
+) -> Tuple[str, str]:
+    """
+    Stream raw rgb24 frames into a lossless video through an ffmpeg stdin pipe.
+
+    Frames are written one at a time as they are produced, so only the frame
+    being written is held in memory.
+
+    Args:
+        frames: Iterable of bytes-like rgb24 frames of width * height * 3 bytes
+        width: Frame width
+        height: Frame height
+        output_path: Output path (extension appended if missing)
+        frame_rate: Frame rate
+        video_format: Lossless format name from LOSSLESS_FORMAT_MAPPING
+        ffmpeg_bin: Custom ffmpeg executable path
+
+    Returns:
+        Tuple of (output path, extension)
+
+    Raises:
+        ProcessLookupError: If ffmpeg is not available
+        KeyError: If the format is not a lossless format
+        Exception: If ffmpeg fails
+    """
+    if ffmpeg_bin is None:
+        ffmpeg_bin = ffmpeg_path
+    if ffmpeg_bin is None:
+        raise ProcessLookupError("ffmpeg not found")
+
+    if video_format not in LOSSLESS_FORMAT_MAPPING:
+        raise KeyError(f"Lossless video format '{video_format}' not found. Available formats: {list(LOSSLESS_FORMAT_MAPPING.keys())}")
+    format_config = LOSSLESS_FORMAT_MAPPING[video_format]
+
+    extension = format_config["extension"]
+    if not output_path.endswith(f".{extension}"):
+        output_path = f"{output_path}.{extension}"
+
+    args = [
+        ffmpeg_bin, "-v", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgb24",
+        "-s", f"{width}x{height}", "-r", str(frame_rate), "-i", "-"
+    ] + format_config["main_pass"] + [output_path]
+
+    frame_size = width * height * 3
+    # stderr goes to a file, a pipe nobody drains while frames stream could fill up and block ffmpeg
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(args, stdin=subprocess.PIPE, stderr=stderr_file) as proc:
+            try:
+                for frame in frames:
+                    if len(frame) != frame_size:
+                        raise ValueError(f"Frame has {len(frame)} bytes, expected {frame_size}")
+                    proc.stdin.write(frame)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            except Exception:
+                proc.kill()
+                raise
+            proc.wait()
+
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            raise Exception("FFmpeg subprocess error:\n" + stderr_file.read().decode(*ENCODE_ARGS))
+
+    return output_path, extension
+
+
+def read_raw_frames(video_path: str, ffmpeg_bin: Optional[str] = None) -> Iterator[memoryview]:
+    """
+    Stream a video as raw rgb24 frames through an ffmpeg stdout pipe.
+
+    A single frame buffer is reused: every yielded memoryview is only valid
+    until the next frame is requested. Closing the generator early stops
+    ffmpeg.
+
+    Args:
+        video_path: Video file path
+        ffmpeg_bin: Custom ffmpeg executable path
+
+    Yields:
+        Frame data as a memoryview of width * height * 3 bytes
+    """
+    if ffmpeg_bin is None:
+        ffmpeg_bin = ffmpeg_path
+    if ffmpeg_bin is None:
+        raise ProcessLookupError("ffmpeg not found")
+
+    width, height = _get_video_info(video_path, ffmpeg_bin)[:2]
+    args = [ffmpeg_bin, "-v", "error", "-an", "-i", video_path, "-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+
+    frame = memoryview(bytearray(width * height * 3))
+    with subprocess.Popen(args, stdout=subprocess.PIPE) as proc:
+        try:
+            while True:
+                offset = 0
+                while offset < len(frame):
+                    read = proc.stdout.readinto(frame[offset:])
+                    if not read:
+                        break
+                    offset += read
+                if offset == 0:
+                    break
+                if offset < len(frame):
+                    raise Exception(f"FFmpeg output ended inside a frame ({offset} of {len(frame)} bytes)")
+                yield frame
+            proc.wait()
+        finally:
+            # Generator closed early or failed, ffmpeg is still running
+            if proc.poll() is None:
+                proc.kill()
+
+    if proc.returncode != 0:
+        raise Exception(f"FFmpeg subprocess exited with code {proc.returncode}")
+
+
 def _get_video_info(video_path: str, ffmpeg_bin: Optional[str] = None) -> Tuple[int, int, float, int, bool]:
     """
     Get video information using FFmpeg.
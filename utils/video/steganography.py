@@ -0,0 +1,154 @@
+"""
+Lossless-video steganography carrier.
+
+The payload is laid out contiguously over the raw rgb24 bytes of the frames
+of a lossless video: [16-byte header][data][zero padding]. The header holds
+the magic b"ETSV" and the big-endian payload length.
+"""
+
+import math
+import struct
+from typing import Optional, Tuple
+
+from .ffmpeg import _get_video_info, read_raw_frames, write_raw_frames
+
+VIDEO_STEGANOGRAPHY_MAGIC = b"ETSV"
+_VIDEO_HEADER = struct.Struct(">4sQ4x")
+VIDEO_STEGANOGRAPHY_HEADER_SIZE = _VIDEO_HEADER.size  # 16 bytes
+
+
+def _payload_frames(data, frame_size: int):
+    """
+    Yield the rgb24 frames carrying header + data.
+
+    Full data frames are zero-copy slices of the payload, only the first
+    (header) and the last (padded) frame go through one reused frame buffer.
+    """
+    view = memoryview(data).cast("B")
+    buffer = bytearray(frame_size)
+
+    header = _VIDEO_HEADER.pack(VIDEO_STEGANOGRAPHY_MAGIC, len(view))
+    first_length = min(len(view), frame_size - len(header))
+    buffer[:len(header)] = header
+    buffer[len(header):len(header) + first_length] = view[:first_length]
+    yield buffer
+
+    offset = first_length
+    while len(view) - offset >= frame_size:
+        yield view[offset:offset + frame_size]
+        offset += frame_size
+
+    if offset < len(view):
+        remaining = len(view) - offset
+        buffer[:remaining] = view[offset:]
+        buffer[remaining:] = bytes(frame_size - remaining)
+        yield buffer
+
+
+def video_steganography_frame_count(data_length: int, width: int, height: int) -> int:
+    """
+    Number of frames needed to carry data_length bytes.
+
+    Args:
+        data_length: Payload size in bytes
+        width: Frame width
+        height: Frame height
+
+    Returns:
+        Frame count (at least 1)
+    """
+    frame_size = width * height * 3
+    return -(-(VIDEO_STEGANOGRAPHY_HEADER_SIZE + data_length) // frame_size)
+
+
+def encode_steganography_video(
+        data_bytes,
+        output_path: str,
+        width: int = 1024,
+        height: int = 1024,
+        frame_rate: int = 30,
+        video_format: str = "ffv1-mkv",
+        ffmpeg_bin: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Stream bytes frame by frame into a lossless video.
+
+    Frames are produced lazily and piped to ffmpeg one at a time, so memory
+    beyond the payload itself stays at one frame regardless of payload size.
+
+    Args:
+        data_bytes: Bytes to encode
+        output_path: Output path (extension appended if missing)
+        width: Frame width
+        height: Frame height
+        frame_rate: Frame rate
+        video_format: Lossless format name ("ffv1-mkv" or "h264rgb-mkv")
+        ffmpeg_bin: Custom ffmpeg executable path
+
+    Returns:
+        Tuple of (output path, extension)
+
+    Raises:
+        ValueError: If the frame is too small for the header
+    """
+    frame_size = width * height * 3
+    if frame_size <= VIDEO_STEGANOGRAPHY_HEADER_SIZE:
+        raise ValueError(f"Frame size {width}x{height} is too small for the {VIDEO_STEGANOGRAPHY_HEADER_SIZE}-byte header")
+
+    return write_raw_frames(_payload_frames(data_bytes, frame_size), width, height, output_path, frame_rate, video_format, ffmpeg_bin)
+
+
+def decode_steganography_video(video_path: str, ffmpeg_bin: Optional[str] = None) -> bytearray:
+    """
+    Extract bytes hidden by encode_steganography_video.
+
+    Frames are read through one reused buffer and copied straight into the
+    output. The output is preallocated up to the capacity estimated from the
+    video duration and grows frame by frame beyond it, so a corrupt header
+    length only fails once the frames actually run out. ffmpeg is stopped as
+    soon as the payload is complete.
+
+    Args:
+        video_path: Video file path
+        ffmpeg_bin: Custom ffmpeg executable path
+
+    Returns:
+        Decoded bytearray
+
+    Raises:
+        ValueError: If the video carries no payload or the payload is truncated
+    """
+    width, height, fps, frame_count, _ = _get_video_info(video_path, ffmpeg_bin)
+    # The frame count is estimated from a duration rounded to 10 ms, so it is only trusted
+    # for preallocation (with that rounding as slack); past it the output grows frame by frame
+    slack_frames = math.ceil(0.005 * fps) + 1
+    estimated_capacity = max(0, (frame_count + slack_frames) * width * height * 3 - VIDEO_STEGANOGRAPHY_HEADER_SIZE)
+
+    frames = read_raw_frames(video_path, ffmpeg_bin)
+    output = None
+    offset = 0
+    try:
+        for frame in frames:
+            if output is None:
+                magic, data_length = _VIDEO_HEADER.unpack_from(frame)
+                if magic != VIDEO_STEGANOGRAPHY_MAGIC:
+                    raise ValueError("Video does not carry a steganography payload")
+                # A hostile header can claim up to 2^64 bytes, never allocate more than the video can hold
+                output = bytearray(min(data_length, estimated_capacity))
+                chunk = frame[VIDEO_STEGANOGRAPHY_HEADER_SIZE:]
+            else:
+                chunk = frame
+
+            # Past the preallocated size the slice assignment appends, growing by at most one frame
+            length = min(len(chunk), data_length - offset)
+            output[offset:offset + length] = chunk[:length]
+            offset += length
+            if offset == data_length:
+                break
+    finally:
+        frames.close()
+
+    if output is None:
+        raise ValueError("Video contains no frames")
+    if offset < data_length:
+        raise ValueError(f"Video payload truncated: {offset} of {data_length} bytes")
+    return output